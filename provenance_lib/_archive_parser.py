@@ -1,12 +1,15 @@
 import abc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from io import BytesIO
+import functools
 import networkx as nx
 import os
 import pandas as pd
-import pathlib
+import re
+import sys
+import threading
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import yaml
 import warnings
 import zipfile
@@ -15,11 +18,80 @@ import bibtexparser as bp
 
 from . import _checksum_validator
 from . import version_parser
-from .util import get_root_uuid, get_nonroot_uuid, UUID, FileName
+from .util import DEFAULT_MAX_WORKERS, get_root_uuid, UUID, FileName
 from ._yaml_constructors import CONSTRUCTOR_REGISTRY, MetadataInfo
 
+# Prefer libyaml's C loader where available; it is much faster than the
+# pure-python SafeLoader, and we call it at least once for every node
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+
+class _ProvYAMLLoader(_SafeLoader):
+    """
+    A SafeLoader that understands the custom YAML tags used in provenance.
+
+    Constructors are registered on this subclass so that we don't modify the
+    global yaml.SafeLoader/CSafeLoader used by everyone else.
+    """
+
+
 for key in CONSTRUCTOR_REGISTRY:
-    yaml.SafeLoader.add_constructor(key, CONSTRUCTOR_REGISTRY[key])
+    _ProvYAMLLoader.add_constructor(key, CONSTRUCTOR_REGISTRY[key])
+
+# Matches the start of any top-level action.yaml line (a key, not a child)
+_TOP_LEVEL_LINE = re.compile(rb'^[^\s#]', re.MULTILINE)
+
+
+def _drop_environment(action_yaml: bytes) -> bytes:
+    """
+    Removes the top-level environment section from raw action.yaml contents
+
+    The environment section lists every package in the conda environment,
+    and is usually most of the file. Nothing here reads it, so we cut it out
+    rather than have the YAML parser build and discard it.
+    """
+    start = action_yaml.find(b'\nenvironment:')
+    if start == -1:
+        return action_yaml
+    end = _TOP_LEVEL_LINE.search(action_yaml, start + len(b'\nenvironment:'))
+    tail = b'' if end is None else action_yaml[end.start():]
+    return action_yaml[:start + 1] + tail
+
+
+# Building a BibTexParser compiles its whole pyparsing grammar, so we build one
+# the first time it is needed and reuse it. The parser collects entries into
+# its bib_database and is not thread-safe, so calls go through _parse_bibtex
+_BIBTEX_PARSER = None  # type: Optional[bp.bparser.BibTexParser]
+_BIBTEX_PARSER_LOCK = threading.Lock()
+
+
+def _parse_bibtex(bibtex: str) -> bp.bibdatabase.BibDatabase:
+    """ Parse a bibtex string into a fresh BibDatabase """
+    global _BIBTEX_PARSER
+    with _BIBTEX_PARSER_LOCK:
+        if _BIBTEX_PARSER is None:
+            _BIBTEX_PARSER = bp.bparser.BibTexParser()
+            _BIBTEX_PARSER.expect_multiple_parse = True
+        parser = _BIBTEX_PARSER
+        parser.bib_database = bp.bibdatabase.BibDatabase()
+        if parser.common_strings:
+            parser.bib_database.load_common_strings()
+        return parser.parse(bibtex)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_citation_entries(bibtex: str) -> Dict[str, Dict]:
+    """
+    Parse a bibtex string into a dict of entries keyed on bibtex ID
+
+    Nodes created by the same plugins carry identical citations.bib files, so
+    results are cached on the bibtex content. Callers must copy before
+    modifying the returned entries.
+    """
+    return _parse_bibtex(bibtex).get_entry_dict()
 
 
 @dataclass(frozen=False)
@@ -28,6 +100,8 @@ class Config():
     parse_study_metadata: bool = True
     recurse: bool = False
     verbose: bool = False
+    # threads used to parse ProvNodes; None means DEFAULT_MAX_WORKERS
+    max_workers: Optional[int] = None
 
 
 @dataclass
@@ -43,10 +117,17 @@ class ParserResults():
 
 class ProvNode:
     """ One node of a provenance DAG, describing one QIIME 2 Result """
+    # DAGs may hold many thousands of these, so skip the per-instance __dict__
+    __slots__ = ('_archive_version', '_framework_version', '_result_md',
+                 'action', '_citations', '_metadata',
+                 '_artifacts_passed_as_md', '_uuid_cached',
+                 '_has_provenance_cached')
+    _uuid_cached: UUID
+    _has_provenance_cached: bool
 
     @property
     def _uuid(self) -> UUID:
-        return self._result_md.uuid
+        return self._uuid_cached
 
     @_uuid.setter
     def _uuid(self, new_uuid: UUID):
@@ -57,6 +138,7 @@ class ProvNode:
         and its ProvNodes.
         """
         self._result_md.uuid = new_uuid
+        self._uuid_cached = new_uuid
 
     @property
     def type(self) -> str:
@@ -76,7 +158,7 @@ class ProvNode:
 
     @property
     def has_provenance(self) -> bool:
-        return self.archive_version != '0'
+        return self._has_provenance_cached
 
     @property
     def citations(self) -> Dict:
@@ -105,10 +187,10 @@ class ProvNode:
         return md
 
     @property
-    def _parents(self) -> Optional[List[Dict[str, UUID]]]:
+    def _parents(self) -> Optional[List[Tuple[str, UUID]]]:
         """
-        a list of single-item {Type: UUID} dicts describing this
-        action's inputs, and including Artifacts passed as Metadata parameters.
+        a list of (input name, UUID) tuples describing this action's inputs,
+        and including Artifacts passed as Metadata parameters.
 
         Returns [] if this "action" is an Import
 
@@ -118,56 +200,74 @@ class ProvNode:
         ProvDAG and its extensions should use the networkx.DiGraph itself to
         work with ancestry when possible.
         """
-        self._artifacts_passed_as_md: List[Dict[str, UUID]]
+        self._artifacts_passed_as_md: List[Tuple[str, UUID]]
 
         if not self.has_provenance:
             return None
 
         inputs = self.action._action_details.get('inputs')
         parents = []
-        if inputs is not None:
+        if inputs:
             # Inputs are a list of single-item dicts, so we have to
             for input in inputs:
-                name, value = next(iter(input.items()))
+                (name, value), = input.items()
                 # value is usually a uuid, but may be a collection of uuids.
                 # the following are specced in qiime2/core/type/collection
                 if type(value) in (set, list, tuple):
                     for i in range(len(value)):
-                        # Make these unique in case the single-item dicts get
-                        # merged into a single dict downstream.
+                        # Make these unique in case the names get used as
+                        # keys in a single dict downstream.
                         unq_name = f'{name}_{i}'
-                        parents.append({unq_name: value[i]})
+                        parents.append((unq_name, sys.intern(value[i])))
                 elif value is not None:
-                    parents.append({name: value})
+                    parents.append((name, sys.intern(value)))
                 else:
                     # skip None-by-default optional inputs
                     # covered by test_parents_for_table_with_optional_input
                     pass  # pragma: no cover
-        return parents + self._artifacts_passed_as_md
+        parents.extend(self._artifacts_passed_as_md)
+        return parents
 
     def __init__(self, cfg: Config, zf: zipfile.ZipFile,
-                 fps_for_this_result: List[pathlib.Path]) -> None:
+                 fps_for_this_result: List[FileName],
+                 versions: Optional[Tuple[str, str]] = None) -> None:
         """
         Constructs a ProvNode from a zipfile and some filepaths.
 
         This constructor is intentionally flexible, and will parse any
         files handed to it. It is the responsibility of the ParserVx classes to
         decide what files need to be passed.
+
+        Filepaths are zip member names, and may be strs or pathlib paths.
+
+        Parsers that have already read this node's VERSION file may pass
+        its (archive_version, framework_version) as versions, in which case
+        any VERSION filepath is ignored.
         """
-        for fp in fps_for_this_result:
-            if fp.name == 'VERSION':
+        if versions is not None:
+            self._archive_version, self._framework_version = versions
+        for fp in map(str, fps_for_this_result):
+            name = fp.rsplit('/', 1)[-1]
+            if name == 'VERSION':
+                if versions is not None:
+                    continue
                 self._archive_version, self._framework_version = \
                     version_parser.parse_version(zf, fp)
-            elif fp.name == 'metadata.yaml':
-                self._result_md = _ResultMetadata(zf, str(fp))
-            elif fp.name == 'action.yaml':
-                self.action = _Action(zf, str(fp))
-            elif fp.name == 'citations.bib':
-                self._citations = _Citations(zf, str(fp))
-            elif fp.name == 'checksums.md5':
+            elif name == 'metadata.yaml':
+                self._result_md = _ResultMetadata(zf, fp)
+            elif name == 'action.yaml':
+                self.action = _Action(zf, fp)
+            elif name == 'citations.bib':
+                self._citations = _Citations(zf, fp)
+            elif name == 'checksums.md5':
                 # Handled in ProvDAG
                 pass
 
+        # These are read constantly while building and working with the DAG,
+        # so we store them directly rather than deriving them on every access
+        self._uuid_cached = self._result_md.uuid
+        self._has_provenance_cached = self._archive_version != '0'
+
         if self.has_provenance:
             all_metadata_fps, self._artifacts_passed_as_md = \
                 self._get_metadata_from_Action(self.action._action_details)
@@ -176,7 +276,7 @@ class ProvNode:
 
     def _get_metadata_from_Action(
         self, action_details: Dict[str, List]) \
-            -> Tuple[Dict[str, str], List[Dict[str, UUID]]]:
+            -> Tuple[Dict[str, str], List[Tuple[str, UUID]]]:
         """
         Gathers data related to Metadata and MetadataColumn-based metadata
         files from an in-memory representation of an action.yaml file.
@@ -192,8 +292,8 @@ class ProvNode:
 
         Returns a two-tuple (all_metadata, artifacts_as_metadata) where:
         - all-metadata conforms to {parameter_name: relative_filename}
-        - artifacts_as_metadata is a list of single-item dictionaries
-        conforming to [{'artifact_passed_as_metadata': <uuid>}, ...]
+        - artifacts_as_metadata is a list of two-tuples
+        conforming to [('artifact_passed_as_metadata', <uuid>), ...]
 
         Input data looks like this:
 
@@ -226,19 +326,17 @@ class ProvNode:
         "real" parent Artifact nodes, which have accurate Type information.
         The filler type is moot.
         """
-        all_metadata = dict()
-        artifacts_as_metadata = []
+        all_metadata = {}
+        artifacts_as_metadata = []  # type: List[Tuple[str, UUID]]
         if (all_params := action_details.get('parameters')) is not None:
             for param in all_params:
-                param_val = next(iter(param.values()))
+                # params are single-item dicts
+                (param_name, param_val), = param.items()
                 if isinstance(param_val, MetadataInfo):
-                    param_name = next(iter(param))
-                    md_fp = param_val.relative_fp
-                    all_metadata.update({param_name: md_fp})
-
-                    artifacts_as_metadata += [
-                        {'artifact_passed_as_metadata': uuid} for uuid in
-                        param_val.input_artifact_uuids]
+                    all_metadata[param_name] = param_val.relative_fp
+                    artifacts_as_metadata.extend(
+                        ('artifact_passed_as_metadata', uuid) for uuid in
+                        param_val.input_artifact_uuids)
 
         return all_metadata, artifacts_as_metadata
 
@@ -255,19 +353,17 @@ class ProvNode:
         original associated parameter, the type (MetadataColumn or Metadata),
         and the appropriate Series or Dataframe respectively.
         """
+        # Zip member names always use '/', so plain strings are safe here
         root_uuid = get_root_uuid(zf)
-        pfx = pathlib.Path(root_uuid) / 'provenance'
         if root_uuid == self._uuid:
-            pfx = pfx / 'action'
+            pfx = f'{root_uuid}/provenance/action/'
         else:
-            pfx = pfx / 'artifacts' / self._uuid / 'action'
+            pfx = f'{root_uuid}/provenance/artifacts/{self._uuid}/action/'
 
-        all_md = dict()
-        for param_name in metadata_fps:
-            filename = str(pfx / metadata_fps[param_name])
-            with zf.open(filename) as myfile:
-                df = pd.read_csv(BytesIO(myfile.read()), sep='\t')
-                all_md.update({param_name: df})
+        all_md = {}
+        for param_name, rel_fp in metadata_fps.items():
+            with zf.open(pfx + rel_fp) as myfile:
+                all_md[param_name] = pd.read_csv(myfile, sep='\t')
 
         return all_md
 
@@ -277,16 +373,20 @@ class ProvNode:
     __str__ = __repr__
 
     def __hash__(self) -> int:
-        return hash(self._uuid)
+        return hash(self._uuid_cached)
 
     def __eq__(self, other) -> bool:
-        return (self.__class__ == other.__class__
-                and self._uuid == other._uuid
+        if self is other:
+            return True
+        return (self.__class__ is other.__class__
+                and self._uuid_cached == other._uuid
                 )
 
 
 class _Action:
     """ Provenance data from action.yaml for a single QIIME 2 Result """
+    __slots__ = ('_action_details', '_execution_details', '_transformers',
+                 '_action_name', '_plugin')
 
     @property
     def action_id(self) -> str:
@@ -323,10 +423,7 @@ class _Action:
         """
         The name of the action itself. Returns 'import' if this is an import.
         """
-        action_name = self._action_details.get('action')
-        if self.action_type == 'import':
-            action_name = 'import'
-        return action_name
+        return self._action_name
 
     @property
     def plugin(self) -> str:
@@ -334,12 +431,7 @@ class _Action:
         The plugin which executed this Action. Returns 'framework' if this is
         an import.
         """
-        plugin = self._action_details.get('plugin')
-        if self.action_type == 'import':
-            plugin = 'framework'
-        # This plugin id will be sent to the PM during replay, so python-style
-        plugin = plugin.replace('-', '_')
-        return plugin
+        return self._plugin
 
     @property
     def inputs(self) -> dict:
@@ -383,13 +475,24 @@ class _Action:
         """
         Returns this action's transformers dictionary if any.
         """
-        return self._action_dict.get('transformers')
+        return self._transformers
 
     def __init__(self, zf: zipfile.ZipFile, fp: str):
-        self._action_dict = yaml.safe_load(zf.read(fp))
-        self._action_details = self._action_dict['action']
-        self._execution_details = self._action_dict['execution']
-        self._env_details = self._action_dict['environment']
+        action_dict = yaml.load(_drop_environment(zf.read(fp)),
+                                Loader=_ProvYAMLLoader)
+        self._action_details = action_dict['action']
+        self._execution_details = action_dict['execution']
+        self._transformers = action_dict.get('transformers')
+
+        # Derived once here, as replay reads these for every node
+        if self._action_details['type'] == 'import':
+            self._action_name = 'import'
+            plugin = 'framework'
+        else:
+            self._action_name = self._action_details.get('action')
+            plugin = self._action_details.get('plugin')
+        # This plugin id will be sent to the PM during replay, so python-style
+        self._plugin = plugin.replace('-', '_')
 
     def __repr__(self):
         return (f"_Action(action_id={self.action_id}, type={self.action_type},"
@@ -403,10 +506,25 @@ class _Citations:
 
     This ID is also stored in the value dicts, making it straightforward to
     convert these back to BibDatabase objects e.g. list(self.citations.values()
+
+    Most uses of a ProvDAG never look at citations, and bibtex parsing is slow,
+    so we hold the raw bibtex and parse it the first time citations are read.
     """
+    __slots__ = ('_raw_bib', '_citations')
+    _raw_bib: str
+    _citations: Optional[Dict[str, Dict]]
+
+    @property
+    def citations(self) -> Dict[str, Dict]:
+        if self._citations is None:
+            entries = _parse_citation_entries(self._raw_bib)
+            self._citations = {
+                key: dict(entry) for key, entry in entries.items()}
+        return self._citations
+
     def __init__(self, zf: zipfile.ZipFile, fp: str):
-        bib_db = bp.loads(zf.read(fp))
-        self.citations = bib_db.get_entry_dict()
+        self._raw_bib = zf.read(fp).decode('utf-8')
+        self._citations = None
 
     def __repr__(self):
         keys = list(self.citations.keys())
@@ -415,9 +533,12 @@ class _Citations:
 
 class _ResultMetadata:
     """ Basic metadata about a single QIIME 2 Result from metadata.yaml """
+    __slots__ = ('uuid', 'type', 'format')
+
     def __init__(self, zf: zipfile.ZipFile, md_fp: str):
-        _md_dict = yaml.safe_load(zf.read(md_fp))
-        self.uuid = _md_dict['uuid']
+        # metadata.yaml is tiny, so one read beats a buffered stream
+        _md_dict = yaml.load(zf.read(md_fp), Loader=_ProvYAMLLoader)
+        self.uuid = sys.intern(_md_dict['uuid'])
         self.type = _md_dict['type']
         self.format = _md_dict['format']
 
@@ -448,6 +569,29 @@ class Parser(metaclass=abc.ABCMeta):
         """
 
 
+def _archive_fp(archive_data: Any) -> Optional[FileName]:
+    """
+    Returns the path of archive_data, or None if it is a file-like object.
+    Only archives passed as a path can be reopened by worker threads
+    """
+    if isinstance(archive_data, (str, os.PathLike)):
+        return os.fspath(archive_data)
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_archive_version(fp: FileName, stat_key: Tuple[int, ...]) -> str:
+    """
+    Returns the archive version of the zip archive at fp.
+
+    stat_key identifies the file's state on disk, so a cached version is only
+    reused while the file is unchanged (exceptions are never cached).
+    """
+    with zipfile.ZipFile(fp, 'r') as zf:
+        archive_version, _ = version_parser.parse_version(zf)
+    return archive_version
+
+
 class ArchiveParser(Parser):
     # description from (and more details available at)
     # https://docs.python.org/3/library/zipfile.html#zipfile-objects
@@ -469,9 +613,17 @@ class ArchiveParser(Parser):
         try:
             # By trying to open artifact_data directly, we get more
             # informative errors than with `if zipfile.is_zipfile():`
-            with zipfile.ZipFile(artifact_data, 'r') as zf:
-                archive_version, _ = \
-                    version_parser.parse_version(zf)
+            if isinstance(artifact_data, (str, os.PathLike)):
+                # Archives on disk are often handed to get_parser repeatedly
+                fp = os.path.abspath(artifact_data)
+                st = os.stat(fp)
+                archive_version = _read_archive_version(
+                    fp, (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns,
+                         st.st_ctime_ns))
+            else:
+                with zipfile.ZipFile(artifact_data, 'r') as zf:
+                    archive_version, _ = \
+                        version_parser.parse_version(zf)
             return FORMAT_REGISTRY[archive_version]()
         except Exception as e:
             # Re-raise after appending the name of this parser to the error
@@ -501,7 +653,7 @@ class ParserV0(ArchiveParser):
         with zipfile.ZipFile(archive_data) as zf:
             if cfg.perform_checksum_validation:
                 provenance_is_valid, checksum_diff = \
-                    self._validate_checksums(zf)
+                    self._validate_checksums(zf, _archive_fp(archive_data))
             else:
                 provenance_is_valid, checksum_diff = (
                     _checksum_validator.ValidationCode.VALIDATION_OPTOUT, None)
@@ -515,10 +667,10 @@ class ParserV0(ArchiveParser):
             root_md = self._parse_root_md(zf, uuid)
             parsed_artifact_uuids = {root_md.uuid}
             expected_files = self.expected_files_in_all_nodes
-            prov_data_fps = [pathlib.Path(uuid) / fp for fp in expected_files]
+            prov_data_fps = [f'{uuid}/{fp}' for fp in expected_files]
             archv_contents[uuid] = ProvNode(cfg, zf, prov_data_fps)
             archv_contents = self._digraph_from_archive_contents(
-                archv_contents)
+                archv_contents.items())
 
         return ParserResults(
             parsed_artifact_uuids,
@@ -532,12 +684,17 @@ class ParserV0(ArchiveParser):
         """ Get archive metadata including root uuid """
         # All files in zf start with root uuid, so we'll grab it from the first
         root_md_fp = root_uuid + '/metadata.yaml'
-        if root_md_fp not in zf.namelist():
+        # getinfo is a dict lookup; namelist() copies and scans every name
+        try:
+            zf.getinfo(root_md_fp)
+        except KeyError:
             raise ValueError("Malformed Archive: root metadata.yaml file "
                              f"misplaced or nonexistent in {zf.filename}")
         return _ResultMetadata(zf, root_md_fp)
 
-    def _validate_checksums(self, zf: zipfile.ZipFile) -> \
+    def _validate_checksums(
+            self, zf: zipfile.ZipFile,
+            archive_fp: Optional[FileName] = None) -> \
             Tuple[_checksum_validator.ValidationCode,
                   Optional[_checksum_validator.ChecksumDiff]]:
         """
@@ -549,40 +706,39 @@ class ParserV0(ArchiveParser):
                 None)
 
     def _digraph_from_archive_contents(
-            self, archive_contents: Dict[UUID, 'ProvNode']) -> nx.DiGraph:
-        """
-        Builds a networkx.DiGraph from a {UUID: ProvNode} dictionary, like the
-        one created in parse_prov().
+            self, archive_contents: Iterable[Tuple[UUID, 'ProvNode']]) \
+            -> nx.DiGraph:
+        """
+        Builds a networkx.DiGraph from (UUID, ProvNode) pairs, like those
+        produced in parse_prov(). The pairs are consumed once, as they arrive,
+        so they may be streamed in while other nodes are still being parsed.
+
+        1. in a single pass over archive_contents, gather nodes and their
+           required attributes in an n_bunch, and edges from each node's
+           parents in an ebunch
+        2. create guaranteed node attributes for any !no-provenance parent
+           nodes, which wouldn't otherwise have them
+        3. build the DiGraph from both bunches
+        """
+        nbunch = []
+        ebunch = []  # type: List[Tuple[UUID, UUID]]
+        parsed_ids = set()  # type: Set[UUID]
+        for n_id, node in archive_contents:
+            parsed_ids.add(n_id)
+            nbunch.append((n_id, {'node_data': node,
+                                  'has_provenance': node.has_provenance}))
+            if parents := node._parents:
+                ebunch.extend(
+                    (parent_uuid, n_id) for _, parent_uuid in parents)
+
+        nbunch.extend(
+            (parent_uuid, {'node_data': None, 'has_provenance': False})
+            for parent_uuid in dict.fromkeys(edge[0] for edge in ebunch)
+            if parent_uuid not in parsed_ids)
 
-        0. Create an empty nx.digraph
-        1. gather nodes and their required attributes in an n_bunch and add
-           to the DiGraph
-        2. Add edges to graph (including all !no-provenance nodes)
-        3. Create guaranteed node attributes for these no-provenance nodes,
-           which wouldn't otherwise have them.
-        """
         dag = nx.DiGraph()
-        nbunch = [
-            (n_id, dict(
-                node_data=archive_contents[n_id],
-                has_provenance=archive_contents[n_id].has_provenance,
-                )) for n_id in archive_contents]
         dag.add_nodes_from(nbunch)
-
-        ebunch = []
-        for node_id, attrs in dag.nodes(data=True):
-            if parents := attrs['node_data']._parents:
-                for parent in parents:
-                    # parent is a single-item {type: uuid} dict
-                    parent_uuid = next(iter(parent.values()))
-                    ebunch.append((parent_uuid, node_id))
         dag.add_edges_from(ebunch)
-
-        for node_id, attrs in dag.nodes(data=True):
-            if attrs.get('node_data') is None:
-                attrs['has_provenance'] = False
-                attrs['node_data'] = None
-
         return dag
 
 
@@ -608,72 +764,72 @@ class ParserV1(ParserV0):
         e.g: <archive_root_uuid>/provenance/artifacts/<uuid>/metadata.yaml
         or <archive_root_uuid>/provenance/artifacts/<uuid>/action/action.yaml
         """
-        archv_contents = {}
-
         with zipfile.ZipFile(archive_data) as zf:
+            # VALIDATION_OPTOUT means no checksum work or I/O at all
             if cfg.perform_checksum_validation:
                 provenance_is_valid, checksum_diff = \
-                    self._validate_checksums(zf)
+                    self._validate_checksums(zf, _archive_fp(archive_data))
             else:
                 provenance_is_valid, checksum_diff = (
                     _checksum_validator.ValidationCode.VALIDATION_OPTOUT, None)
 
             prov_data_fps = self._get_prov_data_fps(
-                zf, self.expected_files_in_all_nodes,
-                self.expected_files_root_only)
+                zf, self.expected_files_in_all_nodes)
+            # for constant-time lookups when checking for missing files
+            prov_data_fp_set = frozenset(prov_data_fps)
             root_uuid = get_root_uuid(zf)
 
             root_md = self._parse_root_md(zf, root_uuid)
 
-            # make a provnode for each UUID
+            # collect the UUIDs of the nodes described by provenance files.
+            # the root goes first, and is checked even if its files are missing
+            node_uuids = {root_uuid: None}  # type: Dict[UUID, None]
             for fp in prov_data_fps:
-                fps_for_this_result = []
-                # if no 'artifacts' -> this is provenance for the archive root
-                if 'artifacts' not in fp.parts:
-                    node_uuid = root_uuid
-                    prefix = pathlib.Path(node_uuid) / 'provenance'
-                    root_only_expected_fps = [
-                        pathlib.Path(node_uuid) / filename for filename in
-                        self.expected_files_root_only]
-                    fps_for_this_result += root_only_expected_fps
+                # <root>/provenance/artifacts/<uuid>/... is non-root provenance
+                parts = fp.split('/', 4)
+                if len(parts) == 5 and parts[2] == 'artifacts':
+                    node_uuids[sys.intern(parts[3])] = None
+
+            # gather and check the files we need to make a provnode per UUID
+            node_fps_to_parse = \
+                {}  # type: Dict[UUID, Tuple[List[FileName], Tuple[str, str]]]
+            for node_uuid in node_uuids:
+                if node_uuid == root_uuid:
+                    prefix = f'{root_uuid}/provenance/'
                 else:
-                    node_uuid = get_nonroot_uuid(fp)
-                    prefix = pathlib.Path(*fp.parts[0:4])
-
-                if node_uuid not in archv_contents:
-                    # get version-specific expected_files_in_all_nodes
-                    v_fp = prefix / 'VERSION'
-                    result_vzn, _ = version_parser.parse_version(zf, v_fp)
-                    exp_files = \
-                        FORMAT_REGISTRY[result_vzn].expected_files_in_all_nodes
-
-                    fps_for_this_result.extend(
-                        [prefix / name for name in exp_files])
-
-                    # Warn and reset provenance_is_valid if expected files are
-                    # missing
-                    files_are_missing = False
-                    error_contents = "Malformed Archive: "
-                    for fp in fps_for_this_result:
-                        if fp not in prov_data_fps:
-                            files_are_missing = True
-                            provenance_is_valid = \
-                                _checksum_validator.ValidationCode.INVALID
-                            error_contents += (
-                                f"{fp.name} file for node {node_uuid} "
-                                f"misplaced or nonexistent in {zf.filename}.\n"
-                                )
-
-                    if(files_are_missing):
-                        error_contents += (
-                            f"Archive {root_uuid} may be corrupt "
-                            "or provenance may be false.")
-                        raise ValueError(error_contents)
-
-                    archv_contents[node_uuid] = ProvNode(cfg, zf,
-                                                         fps_for_this_result)
-
-        archv_contents = self._digraph_from_archive_contents(archv_contents)
+                    prefix = f'{root_uuid}/provenance/artifacts/{node_uuid}/'
+
+                # get version-specific expected_files_in_all_nodes
+                v_fp = prefix + 'VERSION'
+                versions = version_parser.parse_version(zf, v_fp)
+                exp_files = \
+                    FORMAT_REGISTRY[versions[0]].expected_files_in_all_nodes
+
+                fps_for_this_result = [prefix + name for name in exp_files]
+
+                # Raise if expected files are missing
+                if not prov_data_fp_set.issuperset(fps_for_this_result):
+                    missing = [fp for fp in fps_for_this_result
+                               if fp not in prov_data_fp_set]
+                    error_contents = "Malformed Archive: " + "".join(
+                        f"{fp.rsplit('/', 1)[-1]} file for node {node_uuid} "
+                        f"misplaced or nonexistent in {zf.filename}.\n"
+                        for fp in missing)
+                    error_contents += (
+                        f"Archive {root_uuid} may be corrupt "
+                        "or provenance may be false.")
+                    raise ValueError(error_contents)
+
+                # VERSION has been parsed, so the ProvNode needn't reopen it
+                node_fps_to_parse[node_uuid] = (
+                    [fp for fp in fps_for_this_result if fp != v_fp],
+                    versions)
+
+            # Nodes stream into the graph builder as they are parsed, so this
+            # must run before zf (and any worker handles) are closed
+            archv_contents = self._digraph_from_archive_contents(
+                self._parse_prov_nodes(
+                    cfg, zf, archive_data, node_fps_to_parse))
 
         parsed_artifact_uuids = {root_md.uuid}
         return ParserResults(
@@ -683,7 +839,55 @@ class ParserV1(ParserV0):
             checksum_diff
         )
 
-    def _validate_checksums(self, zf: zipfile.ZipFile) -> \
+    def _parse_prov_nodes(
+            self, cfg: Config, zf: zipfile.ZipFile, archive_data: FileName,
+            node_fps: Dict[UUID, Tuple[List[FileName], Tuple[str, str]]]) \
+            -> Iterator[Tuple[UUID, ProvNode]]:
+        """
+        Yields (UUID, ProvNode) pairs from a {UUID: (filepaths, versions)}
+        dict, parsing nodes concurrently in a thread pool. Nodes keep the order
+        of node_fps, and each is yielded as soon as it and those before it are
+        parsed.
+
+        Concurrent reads through one ZipFile are not safe, so each worker
+        thread opens its own handle on the archive. Only archives passed as a
+        path can be reopened like this, so file-like archive_data is parsed
+        serially using zf, as is everything when only one worker is available.
+        cfg.max_workers of None means DEFAULT_MAX_WORKERS.
+        """
+        max_workers = (DEFAULT_MAX_WORKERS if cfg.max_workers is None
+                       else cfg.max_workers)
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers must be at least 1, not {cfg.max_workers}")
+        if (max_workers == 1
+                or not isinstance(archive_data, (str, os.PathLike))):
+            for node_uuid, (fps, versions) in node_fps.items():
+                yield node_uuid, ProvNode(cfg, zf, fps, versions)
+            return
+
+        worker_state = threading.local()
+        worker_zfs = []  # type: List[zipfile.ZipFile]
+
+        def parse_node(
+                node_data: Tuple[List[FileName], Tuple[str, str]]) \
+                -> ProvNode:
+            if (worker_zf := getattr(worker_state, 'zf', None)) is None:
+                worker_zf = worker_state.zf = zipfile.ZipFile(archive_data)
+                worker_zfs.append(worker_zf)
+            return ProvNode(cfg, worker_zf, *node_data)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                yield from zip(node_fps,
+                               executor.map(parse_node, node_fps.values()))
+        finally:
+            for worker_zf in worker_zfs:
+                worker_zf.close()
+
+    def _validate_checksums(
+            self, zf: zipfile.ZipFile,
+            archive_fp: Optional[FileName] = None) -> \
             Tuple[_checksum_validator.ValidationCode,
                   Optional[_checksum_validator.ChecksumDiff]]:
         """
@@ -696,19 +900,22 @@ class ParserV1(ParserV0):
                 None)
 
     def _get_prov_data_fps(self, zf: zipfile.ZipFile,
-                           expected_files_all_nodes: Tuple['str', ...],
-                           expected_files_root_only: Tuple['str', ...]) -> \
-            List[pathlib.Path]:
-        fps = [pathlib.Path(fp) for fp in zf.namelist()
-               if 'provenance' in fp
-               # and any of the expected filenames show up in the filepath
-               and any(map(lambda x: x in fp, expected_files_all_nodes))
-               ]
-        # some files (checksums.md5) exist only at the root level, so we add em
-        root_uuid = get_root_uuid(zf)
-        fps.extend(
-            [pathlib.Path(root_uuid) / filename
-             for filename in expected_files_root_only])
+                           expected_files_all_nodes: Tuple['str', ...]) -> \
+            List[FileName]:
+        """
+        Returns the filepaths of all provenance files that ProvNodes parse.
+
+        Root-only files like checksums.md5 are the business of
+        _validate_checksums, so they are not gathered or checked here. This
+        keeps parsing free of checksum I/O when validation is opted out.
+        """
+        # str.endswith takes a tuple, checking all expected filenames in C
+        expected_suffixes = tuple(
+            '/' + filename for filename in expected_files_all_nodes)
+        # infolist() is the ZipFile's own index, where namelist() copies it
+        fps = [info.filename for info in zf.infolist()
+               if info.filename.endswith(expected_suffixes)
+               and '/provenance/' in info.filename]
         return fps
 
 
@@ -755,14 +962,11 @@ class ParserV5(ParserV4):
     expected_files_in_all_nodes = ParserV4.expected_files_in_all_nodes
     expected_files_root_only = ('checksums.md5', )
 
-    def parse_prov(self, cfg: Config, archive_data: FileName) -> ParserResults:
-        """
-        Parses provenance data for one Archive, applying the local
-        _validate_checksums() method to the v1 parser
-        """
-        return super().parse_prov(cfg, archive_data)
-
-    def _validate_checksums(self, zf: zipfile.ZipFile) -> \
+    # parse_prov is inherited from ParserV1, which calls this class's
+    # _validate_checksums() through self
+    def _validate_checksums(
+            self, zf: zipfile.ZipFile,
+            archive_fp: Optional[FileName] = None) -> \
             Tuple[_checksum_validator.ValidationCode,
                   Optional[_checksum_validator.ChecksumDiff]]:
         """
@@ -772,7 +976,7 @@ class ParserV5(ParserV4):
         - checksum_diff: Optional[ChecksumDiff], where None only if
             checksums.md5 is missing
         """
-        return _checksum_validator.validate_checksums(zf)
+        return _checksum_validator.validate_checksums(zf, archive_fp)
 
 
 FORMAT_REGISTRY = {
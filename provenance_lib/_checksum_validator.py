@@ -1,15 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum
 import hashlib
 import io
 import pathlib
+import threading
 import warnings
 import zipfile
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union  # noqa: F401 (type comments)
 
-from .util import get_root_uuid
+from .util import DEFAULT_MAX_WORKERS, FileName, get_root_uuid
 from .version_parser import parse_version
 
+# hashlib.file_digest (python 3.11+) hashes with a reusable buffer, releasing
+# the GIL while it works. Older pythons fall back to a read/update loop
+_file_digest = getattr(hashlib, 'file_digest', None)
+
 
 @dataclass
 class ChecksumDiff:
@@ -63,12 +69,15 @@ class ValidationCode(IntEnum):
     VALID = 3                   # Archive known to be valid
 
 
-def validate_checksums(zf: zipfile.ZipFile) -> Tuple[ValidationCode,
-                                                     Optional[ChecksumDiff]]:
+def validate_checksums(
+        zf: zipfile.ZipFile, archive_fp: Optional[FileName] = None) -> \
+        Tuple[ValidationCode, Optional[ChecksumDiff]]:
     """
     Uses diff_checksums to validate the archive's provenance, warning the user
     if checksums.md5 is missing, or if the archive is corrupt/has been modified
 
+    archive_fp is passed through to md5sum_directory.
+
     Returns a (ValidationCode, ChecksumDiff) tuple. For archive formats prior
     to v5, the ChecksumDiff will be empty b/c checksums.md5 does not exist.
 
@@ -80,7 +89,7 @@ def validate_checksums(zf: zipfile.ZipFile) -> Tuple[ValidationCode,
 
     # One broad try/except here saves us more down the call stack
     try:
-        checksum_diff = diff_checksums(zf)
+        checksum_diff = diff_checksums(zf, archive_fp)
         if checksum_diff != ChecksumDiff({}, {}, {}):
             # self._result_md may not have been parsed yet, so get uuid
             root_uuid = get_root_uuid(zf)
@@ -107,11 +116,12 @@ def validate_checksums(zf: zipfile.ZipFile) -> Tuple[ValidationCode,
     return (provenance_is_valid, checksum_diff)
 
 
-def diff_checksums(zf: zipfile.ZipFile) -> ChecksumDiff:
+def diff_checksums(zf: zipfile.ZipFile,
+                   archive_fp: Optional[FileName] = None) -> ChecksumDiff:
     """
     Calculates checksums for all files in an archive (excepting checksums.md5)
     Compares these against the checksums stored in checksums.md5, returning
-    a summary ChecksumDiff
+    a summary ChecksumDiff. archive_fp is passed through to md5sum_directory
 
     For archive formats prior to v5, returns an empty ChecksumDiff b/c
     checksums.md5 does not exist
@@ -124,7 +134,7 @@ def diff_checksums(zf: zipfile.ZipFile) -> ChecksumDiff:
 
     root_dir = pathlib.Path(get_root_uuid(zf))
     checksum_filename = root_dir / 'checksums.md5'
-    obs = dict(x for x in md5sum_directory(zf).items()
+    obs = dict(x for x in md5sum_directory(zf, archive_fp).items()
                if x[0] != checksum_filename)
     exp = dict(from_checksum_format(line) for line in
                zf.open(str(checksum_filename))
@@ -140,7 +150,8 @@ def diff_checksums(zf: zipfile.ZipFile) -> ChecksumDiff:
     return ChecksumDiff(added=added, removed=removed, changed=changed)
 
 
-def md5sum_directory(zf: zipfile.ZipFile) -> dict:
+def md5sum_directory(zf: zipfile.ZipFile,
+                     archive_fp: Optional[FileName] = None) -> dict:
     """
     Returns a mapping of fp/checksum pairs for all files in zf.
 
@@ -149,26 +160,58 @@ def md5sum_directory(zf: zipfile.ZipFile) -> dict:
     QIIME 2 archives.
 
     Code adapted from qiime2/core/util.py
+
+    Hashing and decompression both release the GIL, so when the caller passes
+    archive_fp, the path of the archive zf reads, files are checksummed in a
+    thread pool. Each worker thread reopens archive_fp, because ZipFile reads
+    are not safe to share across threads. Without archive_fp, files are only
+    read through zf: a ZipFile's filename may be an fd, or a path that no
+    longer holds the archive it read.
     """
-    sums = dict()
-    for file in zf.namelist():
-        fp = pathlib.Path(file)
-        if fp.name != 'checksums.md5':
-            file_parts = list(fp.parts)
-            fp_w_o_root_uuid = pathlib.Path(*(file_parts[1:]))
-            sums[str(fp_w_o_root_uuid)] = md5sum(zf, file)
-    return sums
+    # infolist() is zf's own index, and opening members by ZipInfo skips the
+    # name lookup. Member names always use '/', so plain string ops suffice
+    files = []  # type: List[zipfile.ZipInfo]
+    rel_fps = []
+    for info in zf.infolist():
+        if info.filename.rsplit('/', 1)[-1] != 'checksums.md5':
+            files.append(info)
+            rel_fps.append(info.filename.partition('/')[2])
+
+    if archive_fp is None or len(files) < 2:
+        return dict(zip(rel_fps, (md5sum(zf, file) for file in files)))
+    # the worker closure below can't see the narrowing above
+    worker_fp = archive_fp  # type: FileName
+
+    worker_state = threading.local()
+    worker_zfs = []  # type: List[zipfile.ZipFile]
+
+    def checksum(file: zipfile.ZipInfo) -> str:
+        if (worker_zf := getattr(worker_state, 'zf', None)) is None:
+            worker_zf = worker_state.zf = zipfile.ZipFile(worker_fp)
+            worker_zfs.append(worker_zf)
+        return md5sum(worker_zf, file)
+
+    try:
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            return dict(zip(rel_fps, executor.map(checksum, files)))
+    finally:
+        for worker_zf in worker_zfs:
+            worker_zf.close()
 
 
-def md5sum(zf: zipfile.ZipFile, filepath: str) -> str:
+def md5sum(zf: zipfile.ZipFile,
+           filepath: Union[str, zipfile.ZipInfo]) -> str:
     """
-    Given a ZipFile object and relative filepath within the zip archive,
-    returns the md5sum of the file
+    Given a ZipFile object and relative filepath (or ZipInfo) within the zip
+    archive, returns the md5sum of the file
 
     Code adapted from qiime2/core/util.py
     """
-    md5 = hashlib.md5()
     with zf.open(filepath) as fh:
+        if _file_digest is not None:
+            return _file_digest(fh, 'md5').hexdigest()
+
+        md5 = hashlib.md5()
         for chunk in iter(lambda: fh.read(io.DEFAULT_BUFFER_SIZE), b""):
             md5.update(chunk)
     return md5.hexdigest()
@@ -1,3 +1,4 @@
+import sys
 from typing import Any, List, NamedTuple, Set, Union
 import warnings
 
@@ -65,7 +66,8 @@ def metadata_path_constructor(loader, node) -> MetadataInfo:
     raw = loader.construct_scalar(node)
     if ':' in raw:
         artifact_uuids, rel_fp = raw.split(':')
-        artifact_uuids = artifact_uuids.split(',')
+        artifact_uuids = [sys.intern(uuid)
+                          for uuid in artifact_uuids.split(',')]
     else:
         artifact_uuids = []
         rel_fp = raw
@@ -85,7 +87,7 @@ def no_provenance_constructor(loader, node) -> UUID:
     For now at least, this constructor warns but otherwise disregards the
     no-provenance-ness of these. The v0 parser deals with them directly anyway.
     """
-    uuid = loader.construct_scalar(node)
+    uuid = sys.intern(loader.construct_scalar(node))
     warnings.warn(f"Artifact {uuid} was created prior to provenance tracking. "
                   + "Provenance data will be incomplete.", UserWarning)
     return uuid
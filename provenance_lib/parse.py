@@ -1,6 +1,6 @@
 from __future__ import annotations
 import copy
-from typing import Any, List, Mapping, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Type
 
 # import glob
 import networkx as nx
@@ -35,6 +35,8 @@ class ProvDAG:
         will recursively parse all .qza and .qzv files within subdirectories
     verbose: bool = False - if True, will print parsed filenames to stdout,
         indicating progress
+    max_workers: Optional[int] = None - the number of threads used to parse
+        each Archive's provenance. If None, uses one per CPU, capped at eight
 
     ## Properties
 
@@ -81,9 +83,9 @@ class ProvDAG:
 
     complete: `mydag.dag` is the DiGraph containing all recorded provenance
         nodes for this ProvDAG
-    collapsed_view: `mydag.collapsed_view` returns a DiGraph (GraphView)
-    containing a node for each standalone Action or Visualizer and one single
-    node for each Pipeline (like q2view provenance trees)
+    collapsed_view: `mydag.collapsed_view` returns a read-only (frozen)
+    DiGraph containing a node for each standalone Action or Visualizer and one
+    single node for each Pipeline (like q2view provenance trees)
 
     ## About the Nodes
 
@@ -113,18 +115,26 @@ class ProvDAG:
     No-provenance nodes with no v1+ children will always appear as disconnected
     members of the DiGraph.
     """
+    # ProvDAGs are built per archive and unioned, so skip the per-instance
+    # __dict__
+    __slots__ = ('cfg', 'dag', '_parsed_artifact_uuids',
+                 '_provenance_is_valid', '_checksum_diff', '_terminal_uuids',
+                 '_outer_nodes', '_collapsed_view')
+
     def __init__(self, artifact_data: Any = None,
                  validate_checksums: bool = True,
                  parse_metadata: bool = True,
                  recurse: bool = False,
                  verbose: bool = False,
+                 max_workers: Optional[int] = None,
                  ):
         """
         Creates a ProvDAG (digraph) by getting a parser from the parser
         dispatcher, using it to parse the incoming data into a ParserResults,
         and then loading those Results into key fields.
         """
-        cfg = Config(validate_checksums, parse_metadata, recurse, verbose)
+        cfg = Config(validate_checksums, parse_metadata, recurse, verbose,
+                     max_workers)
         parser_results = parse_provenance(cfg, artifact_data)
 
         self.cfg = cfg
@@ -133,8 +143,10 @@ class ProvDAG:
         self._provenance_is_valid = parser_results.provenance_is_valid
         self._checksum_diff = parser_results.checksum_diff
 
-        # clear cache whenever we create a new ProvDAG
+        # clear caches whenever we create a new ProvDAG
         self._terminal_uuids = None  # type: Optional[Set[UUID]]
+        self._outer_nodes = None  # type: Optional[FrozenSet[UUID]]
+        self._collapsed_view = None  # type: Optional[nx.DiGraph]
 
     def __repr__(self) -> str:
         return ('ProvDAG representing these Artifacts '
@@ -161,16 +173,25 @@ class ProvDAG:
         The UUIDs of the terminal nodes in the DAG, generated by selecting all
         nodes in a collapsed view of self.dag with an out-degree of zero.
 
-        We memoize the set of terminal UUIDs to prevent unnecessary traversals,
-        so must set self._terminal_uuid back to None in any method that
-        modifies the structure of self.dag, or the nodes themselves (which are
-        literal UUIDs). These methods include at least union and relabel_nodes.
+        We memoize the set of terminal UUIDs, the outer nodes, and the
+        collapsed view to prevent unnecessary traversals, so must set
+        self._terminal_uuids, self._outer_nodes and self._collapsed_view back
+        to None in any method that modifies the structure of self.dag, or the
+        nodes themselves (which are literal UUIDs). These methods include at
+        least union and relabel_nodes.
         """
         if self._terminal_uuids is not None:
             return self._terminal_uuids
-        cv = self.collapsed_view
-        self._terminal_uuids = {uuid for uuid, out_degree in cv.out_degree()
-                                if out_degree == 0}
+        outer_nodes = self._get_outer_nodes()
+        # Every outer node other than a parsed artifact was reached as the
+        # parent of another outer node, so only parsed artifacts can have an
+        # out-degree of zero within the collapsed view. Check just those,
+        # without building the view.
+        succ = self.dag._succ
+        self._terminal_uuids = {
+            uuid for uuid in self._parsed_artifact_uuids
+            if uuid in succ
+            and not any(child in outer_nodes for child in succ[uuid])}
         return self._terminal_uuids
 
     @property
@@ -184,7 +205,8 @@ class ProvDAG:
     @property
     def terminal_nodes(self) -> Set[ProvNode]:
         """The terminal ProvNodes in the DAG's provenance"""
-        return {self.get_node_data(uuid) for uuid in self.terminal_uuids}
+        node_attrs = self.dag._node
+        return {node_attrs[uuid]['node_data'] for uuid in self.terminal_uuids}
 
     @property
     def provenance_is_valid(self) -> _checksum_validator.ValidationCode:
@@ -199,16 +221,34 @@ class ProvDAG:
         return self.dag.nodes
 
     @property
-    # NOTE: This actually returns a graphview, which is a read-only DiGraph
+    # NOTE: This returns a frozen (read-only) copy of the outer nodes' subgraph
     def collapsed_view(self) -> nx.DiGraph:
-        outer_nodes = set()
-        for terminal_uuid in self._parsed_artifact_uuids:
-            outer_nodes |= self.get_outer_provenance_nodes(terminal_uuid)
-
-        def n_filter(node):
-            return node in outer_nodes
-
-        return nx.subgraph_view(self.dag, filter_node=n_filter)
+        if self._collapsed_view is not None:
+            return self._collapsed_view
+        # A filtered view re-checks node membership on every traversal.
+        # Callers walk this graph repeatedly, so build its compact adjacency
+        # once, frozen to keep it read-only.
+        # DiGraph.subgraph(nodes) may iterate the node set rather than
+        # self.dag, making node order (and so replay output order) depend on
+        # hash seeds. Filtering by predicate keeps self.dag's order.
+        outer_nodes = self._get_outer_nodes()
+        self._collapsed_view = nx.freeze(nx.subgraph_view(
+            self.dag, filter_node=outer_nodes.__contains__).copy())
+        return self._collapsed_view
+
+    def _get_outer_nodes(self) -> FrozenSet[UUID]:
+        """
+        The memoized set of outer provenance nodes of all parsed artifacts,
+        which are the nodes of the collapsed view
+        """
+        if self._outer_nodes is None:
+            outer_nodes = set()  # type: Set[UUID]
+            for terminal_uuid in self._parsed_artifact_uuids:
+                if terminal_uuid not in outer_nodes:
+                    outer_nodes |= \
+                        self.get_outer_provenance_nodes(terminal_uuid)
+            self._outer_nodes = frozenset(outer_nodes)
+        return self._outer_nodes
 
     def has_edge(self, start_node: UUID, end_node: UUID) -> bool:
         """
@@ -218,11 +258,11 @@ class ProvDAG:
         return self.dag.has_edge(start_node, end_node)
 
     def node_has_provenance(self, uuid: UUID) -> bool:
-        return self.dag.nodes[uuid]['has_provenance']
+        return self.dag._node[uuid]['has_provenance']
 
     def get_node_data(self, uuid: UUID) -> ProvNode:
         """ Returns a ProvNode from this ProvDAG selected by UUID """
-        return self.dag.nodes[uuid]['node_data']
+        return self.dag._node[uuid]['node_data']
 
     def predecessors(self, node: UUID, dag: nx.DiGraph = None) \
             -> Set[UUID]:
@@ -235,14 +275,16 @@ class ProvDAG:
         """
         Helper method for safe use of nx.relabel.relabel_nodes.
         By default, this updates the labels of self.dag in place.
-        With copy=True, returns a copy of self with nodes relabeled.
+        With copy=True, returns a copy of self with nodes relabeled. The copy's
+        ProvNodes share their parsed contents with self's (see
+        _copy_for_relabel), so this doesn't deep-copy every node's metadata.
 
         Also updates the DAG's _parsed_artifact_uuids to match the new labels
         to head off KeyErrors downstream, and clears the _terminal_uuids cache.
         """
         mod_dag = self
         if copy:
-            mod_dag = ProvDAG(self)
+            mod_dag = self._copy_for_relabel()
 
         # rename node uuids in the provnode data payloads for consistency
         for node_id in mod_dag:
@@ -251,18 +293,47 @@ class ProvDAG:
         # then update the dag itself
         nx.relabel_nodes(mod_dag.dag, mapping, copy=False)
 
-        mod_dag._parsed_artifact_uuids = {mapping[uuid] for
-                                          uuid in self._parsed_artifact_uuids}
+        # Only the relabeled uuids need to change, so update the set in place
+        parsed_uuids = mod_dag._parsed_artifact_uuids
+        relabeled = parsed_uuids & mapping.keys()
+        parsed_uuids.difference_update(relabeled)
+        parsed_uuids.update(mapping[uuid] for uuid in relabeled)
 
-        # Clear the _terminal_uuids cache of the dag whose nodes we're changing
-        # so that property returns correctly
+        # Clear the cached traversals of the dag whose nodes we're changing
+        # so those properties return correctly
         mod_dag._terminal_uuids = None
+        mod_dag._outer_nodes = None
+        mod_dag._collapsed_view = None
 
         if copy:
             return mod_dag
         else:
             return None
 
+    def _copy_for_relabel(self) -> ProvDAG:
+        """
+        Returns a copy of self that relabel_nodes can safely modify.
+
+        The graph, its attribute dicts, and each ProvNode and its result
+        metadata (which hold the UUIDs relabel_nodes rewrites) are new objects.
+        Everything else a ProvNode holds (its Action, study metadata and
+        citations) is shared with self rather than deep-copied, so treat it
+        as read-only.
+
+        Like ProvDAG(self), the copy gets a default Config.
+        """
+        new_dag = ProvDAG()
+        new_dag.dag = self.dag.copy()
+        for attrs in new_dag.dag._node.values():
+            if (node := attrs['node_data']) is not None:
+                node_copy = copy.copy(node)
+                node_copy._result_md = copy.copy(node._result_md)
+                attrs['node_data'] = node_copy
+        new_dag._parsed_artifact_uuids = set(self._parsed_artifact_uuids)
+        new_dag._provenance_is_valid = self._provenance_is_valid
+        new_dag._checksum_diff = copy.deepcopy(self._checksum_diff)
+        return new_dag
+
     @classmethod
     def union(cls, dags: List[ProvDAG]) -> ProvDAG:
         """
@@ -270,31 +341,46 @@ class ProvDAG:
         arbitrary number of ProvDAGs.
 
         The returned DAG's _parsed_artifact_uuids will include uuids from all
-        dags, and other DAG attributes are reduced conservatively.
+        dags, and other DAG attributes are reduced conservatively. Nodes keep
+        the order of the dags they first appear in, as with nx.compose_all.
         """
         if len(dags) < 2:
             raise ValueError("Please pass at least two ProvDAGs")
 
         new_dag = ProvDAG()
-        new_dag.dag = nx.compose_all((dag.dag for dag in dags))
-
-        # Capture starter values we can accrete/compare to
-        new_dag._parsed_artifact_uuids = dags[0]._parsed_artifact_uuids
-        new_dag._provenance_is_valid = dags[0]._provenance_is_valid
-        new_dag._checksum_diff = dags[0].checksum_diff
-
+        # Copy the first graph once and merge the rest into it in place,
+        # rather than having compose_all rebuild every graph from scratch
+        merged = dags[0].dag.copy()
+        merged_nodes = merged._node
+        # e.g. union([dag, dag]): a graph that is already merged adds nothing
+        merged_graphs = {id(dags[0].dag)}
+        for dag in dags[1:]:
+            if id(dag.dag) in merged_graphs:
+                continue
+            merged_graphs.add(id(dag.dag))
+            for n_id, attrs in dag.dag.nodes(data=True):
+                # A node parsed in one DAG may be a bare !no-provenance parent
+                # in another, so never replace parsed node_data with None
+                if merged_nodes.get(n_id, {}).get('node_data') is None:
+                    merged.add_node(n_id, **attrs)
+            merged.add_edges_from(dag.dag.edges(data=True))
+        new_dag.dag = merged
+
+        # Reduce over all dags at once. ValidationCode is an IntEnum, so min
+        # compares in C and returns the least-valid code itself
+        new_dag._parsed_artifact_uuids = set().union(
+            *(dag._parsed_artifact_uuids for dag in dags))
+        new_dag._provenance_is_valid = min(
+            dag.provenance_is_valid for dag in dags)
+        new_dag.cfg.parse_study_metadata = all(
+            dag.cfg.parse_study_metadata for dag in dags)
+        new_dag.cfg.perform_checksum_validation = all(
+            dag.cfg.perform_checksum_validation for dag in dags)
+
+        # The ChecksumDiff is updated in place below, so copy it rather than
+        # alias dags[0]'s
+        new_dag._checksum_diff = copy.deepcopy(dags[0].checksum_diff)
         for dag in dags[1:]:
-            new_dag._parsed_artifact_uuids = new_dag._parsed_artifact_uuids \
-                                             .union(dag._parsed_artifact_uuids)
-            new_dag._provenance_is_valid = min(new_dag.provenance_is_valid,
-                                               dag.provenance_is_valid)
-            # Min of a bool is False, so we can:
-            new_dag.cfg.parse_study_metadata = min(
-                new_dag.cfg.parse_study_metadata,
-                dag.cfg.parse_study_metadata)
-            new_dag.cfg.perform_checksum_validation = min(
-                new_dag.cfg.perform_checksum_validation,
-                dag.cfg.perform_checksum_validation)
             # Here we retain as much data as possible, preferencing any
             # ChecksumDiff over None. This might mean we keep a clean/empty
             # ChecksumDiff and drop None, used to indicate a missing
@@ -304,15 +390,17 @@ class ProvDAG:
                 continue
 
             if new_dag.checksum_diff is None:
-                new_dag._checksum_diff = dag.checksum_diff
+                new_dag._checksum_diff = copy.deepcopy(dag.checksum_diff)
             else:
                 # Neither ChecksumDiff is None
                 new_dag.checksum_diff.added.update(dag.checksum_diff.added)
                 new_dag.checksum_diff.removed.update(dag.checksum_diff.removed)
                 new_dag.checksum_diff.changed.update(dag.checksum_diff.changed)
 
-        # Clear the _terminal_uuids cache so that property returns correctly
+        # Clear the cached traversals so those properties return correctly
         new_dag._terminal_uuids = None
+        new_dag._outer_nodes = None
+        new_dag._collapsed_view = None
         return new_dag
 
     def get_outer_provenance_nodes(self, _node_id: UUID = None) -> Set[UUID]:
@@ -323,16 +411,30 @@ class ProvDAG:
         and a single node for each Pipeline).
 
         Because the terminal/alias nodes created by pipelines show _pipeline_
-        inputs, this recursion skips over all inner nodes.
+        inputs, this traversal skips over all inner nodes.
+
+        The traversal is iterative, visiting each node once, so deep
+        provenance can't hit the recursion limit.
 
-        NOTE: _node_id exists to support recursive calls and may produce
-        unexpected results if e.g. an "inner" node ID is passed by an external
-        caller.
+        NOTE: _node_id may produce unexpected results if e.g. an "inner" node
+        ID is passed by an external caller.
         """
-        nodes = set() if _node_id is None else {_node_id}
-        parents = [edge_pair[0] for edge_pair in self.dag.in_edges(_node_id)]
-        for uuid in parents:
-            nodes = nodes | self.get_outer_provenance_nodes(uuid)
+        # DiGraph._pred maps each node to a dict keyed on its parents. Reading
+        # it directly saves building an edge view for every visited node
+        pred = self.dag._pred
+        if _node_id is None:
+            to_visit = [parent for parent, children in self.dag._succ.items()
+                        if children]
+        else:
+            to_visit = [_node_id]
+
+        nodes = set()  # type: Set[UUID]
+        while to_visit:
+            node_id = to_visit.pop()
+            if node_id in nodes:
+                continue
+            nodes.add(node_id)
+            to_visit.extend(pred.get(node_id, ()))
         return nodes
 
 
@@ -402,22 +504,34 @@ class DirectoryParser(Parser):
         if not artifacts_to_parse:
             raise ValueError(f"No .qza or .qzv files present in {dir_name}")
 
-        dag = ProvDAG()
+        # Union all parsed archives once at the end. Unioning as we go would
+        # re-copy the growing DAG for every archive. parsed_ids tracks the
+        # nodes with node_data so far, as archive_not_parsed would find them
+        dags = []  # type: List[ProvDAG]
+        parsed_ids = set()  # type: Set[UUID]
+        skipped_ids = set()  # type: Set[UUID]
         for archive in artifacts_to_parse:
             if cfg.verbose:
                 print("parsing", archive)
             with zipfile.ZipFile(archive) as zf:
                 root_id = get_root_uuid(zf)
-            if archive_not_parsed(root_id, dag):
-                dag = ProvDAG.union(
-                    [dag,
-                     ProvDAG(archive,
-                             cfg.perform_checksum_validation,
-                             cfg.parse_study_metadata)])
+            if root_id not in parsed_ids:
+                archive_dag = ProvDAG(archive,
+                                      cfg.perform_checksum_validation,
+                                      cfg.parse_study_metadata,
+                                      max_workers=cfg.max_workers)
+                dags.append(archive_dag)
+                parsed_ids.update(
+                    n_id for n_id, node_data
+                    in archive_dag.dag.nodes(data='node_data')
+                    if node_data is not None)
             else:
                 # Even if we skip a redundant file for efficiency,
                 # we should add its UUID to the list of parsed artifacts
-                dag._parsed_artifact_uuids.add(root_id)
+                skipped_ids.add(root_id)
+
+        dag = dags[0] if len(dags) == 1 else ProvDAG.union(dags)
+        dag._parsed_artifact_uuids |= skipped_ids
 
         return ParserResults(
             dag._parsed_artifact_uuids,
@@ -470,19 +584,29 @@ def parse_provenance(cfg: Config, payload: Any) -> ParserResults:
     return parser.parse_prov(cfg, payload)
 
 
+# Parsers are tried in this order, and the first that can handle a payload wins
+_PARSER_TYPE_REGISTRY = (
+    ArchiveParser,
+    DirectoryParser,
+    ProvDAGParser,
+    EmptyParser,
+)
+
+# Payload types only one parser can handle. These skip straight to it, rather
+# than collecting a failed attempt from every parser tried before it
+_PARSERS_BY_PAYLOAD_TYPE: Dict[type, Type[Parser]] = {
+    type(None): EmptyParser,
+    ProvDAG: ProvDAGParser,
+}
+
+
 def select_parser(payload: Any) -> Parser:
     """
     Selects a parser that can_handle some given payload.
     """
-    _PARSER_TYPE_REGISTRY = [
-        ArchiveParser,
-        DirectoryParser,
-        ProvDAGParser,
-        EmptyParser,
-    ]
-
-    accepted_data_types = [
-        parser.accepted_data_types for parser in _PARSER_TYPE_REGISTRY]
+    if (parser_type := _PARSERS_BY_PAYLOAD_TYPE.get(type(payload))) \
+            is not None:
+        return parser_type.get_parser(payload)
 
     optional_parser = None
     errors = []
@@ -497,6 +621,8 @@ def select_parser(payload: Any) -> Parser:
     else:
         # Errors are only raised if no working parser is found,
         # so we can always raise unparseable_err if we raise errors.
+        accepted_data_types = [
+            parser.accepted_data_types for parser in _PARSER_TYPE_REGISTRY]
         unparseable_err_msg = (
                     f"Input data {payload} is not supported.\n"
                     "Parsers are available for the following data types: "
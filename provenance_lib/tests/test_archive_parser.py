@@ -2,7 +2,7 @@ from datetime import timedelta
 import os
 import networkx as nx
 import pathlib
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import pandas as pd
 import unittest
 import warnings
@@ -14,7 +14,7 @@ from .test_parse import TEST_DATA, DATA_DIR
 from ..util import UUID
 from .._archive_parser import (
     ProvNode, Config, _Action, _Citations, _ResultMetadata, ParserResults,
-    ArchiveParser,
+    ArchiveParser, _drop_environment, _read_archive_version,
 )
 
 from .._yaml_constructors import MetadataInfo
@@ -77,6 +77,51 @@ class ParserVxTests(unittest.TestCase):
                     res.prov_digraph.nodes[root_uuid]['node_data'],
                     ProvNode)
 
+    def test_populate_archive_from_file_object(self):
+        # file-like archives can't be reopened by worker threads, so they take
+        # a serial path through parse_prov
+        for archive_version in TEST_DATA:
+            if archive_version == '0':
+                continue
+            qzv_fp = TEST_DATA[archive_version]['qzv_fp']
+            parser = TEST_DATA[archive_version]['parser']()
+            exp = parser.parse_prov(Config(), qzv_fp).prov_digraph
+            with open(qzv_fp, 'rb') as archive:
+                res = parser.parse_prov(Config(), archive)
+            self.assertEqual(list(res.prov_digraph.nodes), list(exp.nodes))
+            self.assertEqual(set(res.prov_digraph.edges), set(exp.edges))
+
+    def test_populate_archive_with_one_worker(self):
+        for archive_version in TEST_DATA:
+            if archive_version == '0':
+                continue
+            qzv_fp = TEST_DATA[archive_version]['qzv_fp']
+            parser = TEST_DATA[archive_version]['parser']()
+            exp = parser.parse_prov(Config(), qzv_fp).prov_digraph
+            with patch('provenance_lib._archive_parser.ThreadPoolExecutor') \
+                    as pool:
+                res = parser.parse_prov(Config(max_workers=1), qzv_fp)
+            pool.assert_not_called()
+            self.assertEqual(list(res.prov_digraph.nodes), list(exp.nodes))
+            self.assertEqual(set(res.prov_digraph.edges), set(exp.edges))
+
+    def test_populate_archive_with_one_default_worker(self):
+        qzv_fp = TEST_DATA['5']['qzv_fp']
+        parser = TEST_DATA['5']['parser']()
+        exp = parser.parse_prov(Config(), qzv_fp).prov_digraph
+        with patch('provenance_lib._archive_parser.DEFAULT_MAX_WORKERS', 1), \
+                patch('provenance_lib._archive_parser.ThreadPoolExecutor') \
+                as pool:
+            res = parser.parse_prov(Config(), qzv_fp)
+        pool.assert_not_called()
+        self.assertEqual(list(res.prov_digraph.nodes), list(exp.nodes))
+
+    def test_populate_archive_with_no_workers(self):
+        qzv_fp = TEST_DATA['5']['qzv_fp']
+        parser = TEST_DATA['5']['parser']()
+        with self.assertRaisesRegex(ValueError, 'max_workers.*at least 1'):
+            parser.parse_prov(Config(max_workers=0), qzv_fp)
+
     def test_validate_checksums(self):
         for archive_version in TEST_DATA:
             with zipfile.ZipFile(TEST_DATA[archive_version]['qzv_fp']) as zf:
@@ -87,6 +132,18 @@ class ParserVxTests(unittest.TestCase):
                 self.assertEqual(diff,
                                  TEST_DATA[archive_version]['checksum'])
 
+    def test_validate_checksums_gets_archive_path(self):
+        # only archives passed as a path can be checksummed in a thread pool
+        qzv_fp = TEST_DATA['5']['qzv_fp']
+        parser = TEST_DATA['5']['parser']()
+        with patch('provenance_lib._checksum_validator.validate_checksums',
+                   wraps=_checksum_validator.validate_checksums) as validate:
+            parser.parse_prov(Config(), qzv_fp)
+            with open(qzv_fp, 'rb') as archive:
+                parser.parse_prov(Config(), archive)
+        self.assertEqual([call.args[1] for call in validate.call_args_list],
+                         [os.fspath(qzv_fp), None])
+
     def test_correct_validate_checksums_method_called(self):
         # We want to confirm that parse_prov uses the local _validate_checksums
         # even when it calls super().parse_prov() internally
@@ -117,6 +174,14 @@ class ArchiveParserTests(unittest.TestCase):
             parser = ArchiveParser.get_parser(fp)
             self.assertIsInstance(parser, TEST_DATA[version]['parser'])
 
+    def test_get_parser_caches_version_for_unchanged_file(self):
+        fp = os.path.join(DATA_DIR, TEST_DATA['5']['qzv_fp'])
+        ArchiveParser.get_parser(fp)
+        hits = _read_archive_version.cache_info().hits
+        parser = ArchiveParser.get_parser(fp)
+        self.assertIsInstance(parser, TEST_DATA['5']['parser'])
+        self.assertEqual(_read_archive_version.cache_info().hits, hits + 1)
+
     def test_get_parser_nonexistent_fp(self):
         fn = 'not_a_filepath.qza'
         fp = os.path.join(DATA_DIR, fn)
@@ -246,6 +311,19 @@ class ActionTests(unittest.TestCase):
                'action=core_metrics_phylogenetic)')
         self.assertEqual(repr(self.act), exp)
 
+    def test_drop_environment(self):
+        raw = (b'execution:\n  uuid: abc\naction:\n  type: import\n'
+               b'environment:\n  platform: linux\n  plugins:\n'
+               b'    diversity:\n      version: 2021.4.0\n'
+               b'transformers:\n  output: []\n')
+        exp = (b'execution:\n  uuid: abc\naction:\n  type: import\n'
+               b'transformers:\n  output: []\n')
+        self.assertEqual(_drop_environment(raw), exp)
+        # environment is usually the last section
+        self.assertEqual(_drop_environment(raw[:raw.index(b'transformers')]),
+                         b'execution:\n  uuid: abc\naction:\n  type: import\n')
+        self.assertEqual(_drop_environment(exp), exp)
+
     # NOTE: Import is not handled by a plugin, so the parser provides values
     # for the action_name and plugin properties not present in action.yaml
     def test_action_for_import_node(self):
@@ -263,35 +341,54 @@ class CitationsTests(unittest.TestCase):
         cite_strs = ['cite_none', 'cite_one', 'cite_many']
         cls.bibs = [bib+'.bib' for bib in cite_strs]
         cls.zips = [os.path.join(DATA_DIR, bib+'.zip') for bib in cite_strs]
+        # Shared by the read-only tests. Tests of construction and parsing
+        # behavior build their own
+        cls.citations = []
+        for zip_fp, bib in zip(cls.zips, cls.bibs):
+            with zipfile.ZipFile(zip_fp) as zf:
+                cls.citations.append(_Citations(zf, bib))
 
     def test_empty_bib(self):
-        with zipfile.ZipFile(self.zips[0]) as zf:
-            citations = _Citations(zf, self.bibs[0])
-            # Is the _citations dict empty?
-            self.assertFalse(len(citations.citations))
+        # Is the _citations dict empty?
+        self.assertFalse(len(self.citations[0].citations))
 
     def test_citation(self):
-        with zipfile.ZipFile(self.zips[1]) as zf:
-            exp = 'framework'
-            citations = _Citations(zf, self.bibs[1])
-            for key in citations.citations:
-                self.assertRegex(key, exp)
+        exp = 'framework'
+        for key in self.citations[1].citations:
+            self.assertRegex(key, exp)
 
     def test_many_citations(self):
         exp = ['2020.6.0.dev0', 'unweighted_unifrac.+0',
                'unweighted_unifrac.+1', 'unweighted_unifrac.+2',
                'unweighted_unifrac.+3', 'unweighted_unifrac.+4',
                'BIOMV210DirFmt', 'BIOMV210Format']
+        for i, key in enumerate(self.citations[2].citations):
+            self.assertRegex(key, exp[i])
+
+    def test_citations_do_not_accumulate(self):
+        # all _Citations share one bibtex parser, so make sure entries from
+        # one parse don't leak into the next
         with zipfile.ZipFile(self.zips[2]) as zf:
-            citations = _Citations(zf, self.bibs[2])
-            for i, key in enumerate(citations.citations):
-                self.assertRegex(key, exp[i])
+            many = _Citations(zf, self.bibs[2])
+            self.assertEqual(len(many.citations), 8)
+        with zipfile.ZipFile(self.zips[0]) as zf:
+            none = _Citations(zf, self.bibs[0])
+            self.assertEqual(none.citations, {})
+
+    def test_identical_bibs_do_not_share_entries(self):
+        with zipfile.ZipFile(self.zips[2]) as zf:
+            first = _Citations(zf, self.bibs[2])
+            second = _Citations(zf, self.bibs[2])
+        self.assertEqual(first.citations, second.citations)
+        key = next(iter(first.citations))
+        first.citations[key]['title'] = 'changed'
+        del first.citations[key]
+        self.assertIn(key, second.citations)
+        self.assertNotEqual(second.citations[key].get('title'), 'changed')
 
     def test_repr(self):
         exp = ("Citations(['framework|qiime2:2020.6.0.dev0|0'])")
-        with zipfile.ZipFile(self.zips[1]) as zf:
-            citations = _Citations(zf, self.bibs[1])
-            self.assertEqual(repr(citations), exp)
+        self.assertEqual(repr(self.citations[1]), exp)
 
 
 class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
@@ -304,7 +401,7 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
             with zipfile.ZipFile(TEST_DATA[k]['qzv_fp']) as zf:
                 all_filenames = zf.namelist()
                 root_md_fnames = filter(is_root_provnode_data, all_filenames)
-                root_md_fps = [pathlib.Path(fp) for fp in root_md_fnames]
+                root_md_fps = list(root_md_fnames)
                 cls.nodes[k] = ProvNode(cfg, zf, root_md_fps)
 
         # Build a minimal node in which Artifacts are passed as metadata
@@ -327,10 +424,11 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
 
         # Build a nonroot node without study metadata
         with zipfile.ZipFile(TEST_DATA['5']['qzv_fp']) as zf:
-            node_id = '3b7d36ff-37ab-4ac2-958b-6a547d442bcf'
+            # the nodes below are all built from this archive's names
             all_filenames = zf.namelist()
+            node_id = '3b7d36ff-37ab-4ac2-958b-6a547d442bcf'
             node_fps = [
-                pathlib.Path(fp) for fp in all_filenames if
+                fp for fp in all_filenames if
                 node_id in fp and
                 ('metadata.yaml' in fp or 'action.yaml' in fp
                  or 'VERSION' in fp
@@ -339,9 +437,8 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
 
             # Build a nonroot node with study metadata
             node_id = '0af08fa8-48b7-4c6a-83c6-e0f766156343'
-            all_filenames = zf.namelist()
             node_fps = [
-                pathlib.Path(fp) for fp in all_filenames if
+                fp for fp in all_filenames if
                 node_id in fp and
                 ('metadata.yaml' in fp or 'action.yaml' in fp
                  or 'VERSION' in fp
@@ -350,8 +447,8 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
 
             # Build a root node and don't parse study metadata files
             node_id = TEST_DATA['5']['uuid']
-            root_md_fnames = filter(is_root_provnode_data, zf.namelist())
-            root_md_fps = [pathlib.Path(fp) for fp in root_md_fnames]
+            root_md_fnames = filter(is_root_provnode_data, all_filenames)
+            root_md_fps = list(root_md_fnames)
             cfg = Config(parse_study_metadata=False)
             cls.dont_parse_md_files_node = ProvNode(cfg, zf, root_md_fps)
 
@@ -359,7 +456,7 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
         with zipfile.ZipFile(os.path.join(DATA_DIR, 'merged_tbls.qza')) as zf:
             all_filenames = zf.namelist()
             root_md_fnames = filter(is_root_provnode_data, all_filenames)
-            root_md_fps = [pathlib.Path(fp) for fp in root_md_fnames]
+            root_md_fps = list(root_md_fnames)
             cls.input_collection_node = ProvNode(cfg, zf, root_md_fps)
 
         # build a node with an optional input that defaults to None
@@ -367,7 +464,7 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
                 os.path.join(DATA_DIR, 'optional_input_none.qzv')) as zf:
             all_filenames = zf.namelist()
             root_md_fnames = filter(is_root_provnode_data, all_filenames)
-            root_md_fps = [pathlib.Path(fp) for fp in root_md_fnames]
+            root_md_fps = list(root_md_fnames)
             cls.optional_input_node = ProvNode(cfg, zf, root_md_fps)
 
     def test_smoke(self):
@@ -431,6 +528,16 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
             self.assertEqual(self.nodes[node_vzn].framework_version,
                              TEST_DATA[node_vzn]['fwv'])
 
+    def test_versions_passed_in_are_not_reparsed(self):
+        with zipfile.ZipFile(TEST_DATA['5']['qzv_fp']) as zf:
+            root_md_fnames = filter(is_root_provnode_data, zf.namelist())
+            with patch('provenance_lib.version_parser.parse_version') as pv:
+                node = ProvNode(Config(), zf, list(root_md_fnames),
+                                versions=('5', '2018.11.0'))
+            pv.assert_not_called()
+        self.assertEqual(node.archive_version, '5')
+        self.assertEqual(node.framework_version, '2018.11.0')
+
     def test_get_metadata_from_action(self):
         find_md = self.nodes['5']._get_metadata_from_Action
         md1 = MetadataInfo([], 'some_metadata.tsv')
@@ -449,9 +556,9 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
                    'other_metadata': 'other_metadata.tsv',
                    'double_md': 'merged_metadata.tsv',
                    }
-        a_as_md_exp = [{'artifact_passed_as_metadata': '301b4'},
-                       {'artifact_passed_as_metadata': '4154'},
-                       {'artifact_passed_as_metadata': '5555b'},
+        a_as_md_exp = [('artifact_passed_as_metadata', '301b4'),
+                       ('artifact_passed_as_metadata', '4154'),
+                       ('artifact_passed_as_metadata', '5555b'),
                        ]
         self.assertEqual(all_md, all_exp)
         self.assertEqual(artifacts_as_md, a_as_md_exp)
@@ -526,8 +633,8 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
         self.assertIn('metadata', self.nonroot_md_node.metadata)
 
     def test_parents(self):
-        exp = [{'table': '89af91c0-033d-4e30-8ac4-f29a3b407dc1'},
-               {'phylogeny': 'bce3d09b-e296-4f2b-9af4-834db6412429'}]
+        exp = [('table', '89af91c0-033d-4e30-8ac4-f29a3b407dc1'),
+               ('phylogeny', 'bce3d09b-e296-4f2b-9af4-834db6412429')]
         self.assertEqual(self.nodes['5']._parents, exp)
 
     def test_parents_no_prov(self):
@@ -536,11 +643,11 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
         self.assertEqual(no_prov_node._parents, None)
 
     def test_parents_with_artifact_passed_as_md(self):
-        exp = [{'tree': 'e710bdc5-e875-4876-b238-5451e3e8eb46'},
-               {'feature_table': 'abc22fdc-e7fa-4976-a980-8f2ff8c4bb58'},
-               {'pcoa': '1ed04b10-d29c-495f-996e-3d4db89434d2'},
-               {'artifact_passed_as_metadata':
-                '415409a4-371d-4c69-9433-e3eaba5301b4'},
+        exp = [('tree', 'e710bdc5-e875-4876-b238-5451e3e8eb46'),
+               ('feature_table', 'abc22fdc-e7fa-4976-a980-8f2ff8c4bb58'),
+               ('pcoa', '1ed04b10-d29c-495f-996e-3d4db89434d2'),
+               ('artifact_passed_as_metadata',
+                '415409a4-371d-4c69-9433-e3eaba5301b4'),
                ]
         actual = self.art_as_md_node._parents
         self.assertEqual(actual, exp)
@@ -550,7 +657,7 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
             import_node_id = 'a35830e1-4535-47c6-aa23-be295a57ee1c'
             reqd_fps = ('VERSION', 'metadata.yaml', 'action.yaml')
             import_node_fps = [
-                pathlib.Path(fp) for fp in zf.namelist()
+                fp for fp in zf.namelist()
                 if import_node_id in fp
                 and any(map(lambda x: x in fp, reqd_fps))
                 ]
@@ -559,14 +666,14 @@ class ProvNodeTests(unittest.TestCase, ReallyEqualMixin):
         self.assertEqual(import_node._parents, [])
 
     def test_parents_for_table_with_collection_of_inputs(self):
-        exp = [{'tables_0': "84898e39-f6e0-44bb-8fa1-6df2f330af68"},
-               {'tables_1': "0be6c7be-ad84-4417-9f1c-cade0a8a9b58"}]
+        exp = [('tables_0', "84898e39-f6e0-44bb-8fa1-6df2f330af68"),
+               ('tables_1', "0be6c7be-ad84-4417-9f1c-cade0a8a9b58")]
         parents = self.input_collection_node._parents
         self.assertEqual(parents, exp)
 
     def test_parents_for_table_with_optional_input(self):
         # NOTE: The None-type input is not captured
-        exp = [{'artifact_passed_as_metadata':
-                "1cc80a0b-1415-49b1-9d58-bd9394e5f613"}]
+        exp = [('artifact_passed_as_metadata',
+                "1cc80a0b-1415-49b1-9d58-bd9394e5f613")]
         parents = self.optional_input_node._parents
         self.assertEqual(parents, exp)
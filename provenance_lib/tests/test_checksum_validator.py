@@ -1,7 +1,10 @@
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import tempfile
 import pathlib
 import unittest
+from unittest.mock import patch
 import zipfile
 
 from .._checksum_validator import (
@@ -260,6 +263,54 @@ class MD5SumDirectoryTests(unittest.TestCase):
                     ('bar/foo.baz', 'dcc0975b66728be0315abae5968379cb')
                 ]))
 
+    def make_many_file_archive(self):
+        contents = {'a': b'1', 'b': b'2', 'nested/c': b'10'}
+        for relpath, bytes_ in contents.items():
+            (self.test_path / relpath).parent.mkdir(exist_ok=True)
+            self.make_zip_archive(bytes_, relpath)
+        return {'a': 'c4ca4238a0b923820dcc509a6f75849b',
+                'b': 'c81e728d9d4c2f636f067f89cc14862c',
+                'nested/c': 'd3d9446802a44259755d38e6d163e820'}
+
+    def test_archive_fp_hashes_in_thread_pool(self):
+        exp = self.make_many_file_archive()
+        with patch('provenance_lib._checksum_validator.ThreadPoolExecutor',
+                   wraps=ThreadPoolExecutor) as pool:
+            with zipfile.ZipFile(self.zip_fname) as zf:
+                self.assertEqual(md5sum_directory(zf, self.zip_fname), exp)
+        pool.assert_called_once()
+
+    def test_no_archive_fp_hashes_serially(self):
+        exp = self.make_many_file_archive()
+        with patch('provenance_lib._checksum_validator.ThreadPoolExecutor') \
+                as pool:
+            with zipfile.ZipFile(self.zip_fname) as zf:
+                self.assertEqual(md5sum_directory(zf), exp)
+        pool.assert_not_called()
+
+    def test_archive_in_temporary_file(self):
+        # a ZipFile on a TemporaryFile has an int fd as its filename
+        exp = self.make_many_file_archive()
+        with tempfile.TemporaryFile() as tmp:
+            with open(self.zip_fname, 'rb') as fh:
+                tmp.write(fh.read())
+            tmp.seek(0)
+            with zipfile.ZipFile(tmp) as zf:
+                self.assertIsInstance(zf.filename, int)
+                self.assertEqual(md5sum_directory(zf), exp)
+            # the caller's file must still be open
+            self.assertFalse(tmp.closed)
+            tmp.seek(0)
+
+    def test_file_object_whose_name_is_stale(self):
+        # the path a file object was opened from may now hold other data
+        exp = self.make_many_file_archive()
+        with open(self.zip_fname, 'rb') as fh:
+            with zipfile.ZipFile(fh) as zf:
+                pathlib.Path(self.zip_fname).unlink()
+                self.make_zip_archive(b'something else', 'a')
+                self.assertEqual(md5sum_directory(zf), exp)
+
 
 class MD5SumTests(unittest.TestCase):
     # Tests adapted from qiime2/core/tests/test_util.py
@@ -310,6 +361,24 @@ class MD5SumTests(unittest.TestCase):
             self.assertEqual(md5sum(zf, arcname),
                              '93b048d0202e4b06b658f3aef1e764d3')
 
+    @unittest.skipUnless(hasattr(hashlib, 'file_digest'),
+                         'hashlib.file_digest requires python 3.11+')
+    def test_file_digest(self):
+        zfpath, arcname = self.make_zip_archive(b'verybigfile' * (1024 * 50))
+        with patch('provenance_lib._checksum_validator._file_digest',
+                   wraps=hashlib.file_digest) as file_digest:
+            with zipfile.ZipFile(zfpath) as zf:
+                self.assertEqual(md5sum(zf, arcname),
+                                 '27d64211ee283283ad866c18afa26611')
+        file_digest.assert_called_once()
+
+    def test_read_loop_without_file_digest(self):
+        zfpath, arcname = self.make_zip_archive(b'verybigfile' * (1024 * 50))
+        with patch('provenance_lib._checksum_validator._file_digest', None):
+            with zipfile.ZipFile(zfpath) as zf:
+                self.assertEqual(md5sum(zf, arcname),
+                                 '27d64211ee283283ad866c18afa26611')
+
 
 class FromChecksumFormatTests(unittest.TestCase):
     # Tests adapted from qiime2/core/tests/test_util.py
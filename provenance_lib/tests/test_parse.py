@@ -140,7 +140,7 @@ class ProvDAGTests(unittest.TestCase):
             with zipfile.ZipFile(TEST_DATA[dag_version]['qzv_fp']) as zf:
                 all_filenames = zf.namelist()
                 root_md_fnames = filter(is_root_provnode_data, all_filenames)
-                root_md_fps = [pathlib.Path(fp) for fp in root_md_fnames]
+                root_md_fps = list(root_md_fnames)
                 exp_node = ProvNode(Config(), zf, root_md_fps)
                 self.assertEqual(len(self.dags[dag_version].terminal_uuids), 1)
                 # This is deterministic because there is one uuid in the set:
@@ -294,22 +294,22 @@ class ProvDAGTests(unittest.TestCase):
 
         # Terminal/alias node
         root_parents = [
-            {'table': '89af91c0-033d-4e30-8ac4-f29a3b407dc1'},
-            {'phylogeny': 'bce3d09b-e296-4f2b-9af4-834db6412429'}]
+            ('table', '89af91c0-033d-4e30-8ac4-f29a3b407dc1'),
+            ('phylogeny', 'bce3d09b-e296-4f2b-9af4-834db6412429')]
         self.assertEqual(nodes[node_list[0]]['node_data']._parents,
                          root_parents)
         # non-alias node
-        n1_parents = [{'table': '89af91c0-033d-4e30-8ac4-f29a3b407dc1'},
+        n1_parents = [('table', '89af91c0-033d-4e30-8ac4-f29a3b407dc1'),
                       ]
         self.assertEqual(nodes[node_list[1]]['node_data']._parents,
                          n1_parents)
         # some other nodes
-        n2_parents = [{'tree': 'd32a5ea6-1ca1-4635-b522-2253568ae35b'},
+        n2_parents = [('tree', 'd32a5ea6-1ca1-4635-b522-2253568ae35b'),
                       ]
         self.assertEqual(nodes[node_list[2]]['node_data']._parents,
                          n2_parents)
-        n3_parents = [{'demultiplexed_seqs':
-                       '99fa3670-aa1a-45f6-ba8e-803c976a1163'}]
+        n3_parents = [('demultiplexed_seqs',
+                       '99fa3670-aa1a-45f6-ba8e-803c976a1163')]
         self.assertEqual(nodes[node_list[3]]['node_data']._parents,
                          n3_parents)
         # import node
@@ -329,10 +329,18 @@ class ProvDAGTests(unittest.TestCase):
         actual = self.dags['5'].get_outer_provenance_nodes(root_uuid)
         self.assertEqual(actual, exp)
 
+    def test_get_outer_provenance_nodes_deep_lineage(self):
+        # a lineage deeper than the recursion limit shouldn't break traversal
+        dag = ProvDAG()
+        depth = 5000
+        nx.add_path(dag.dag, [str(i) for i in range(depth)])
+        actual = dag.get_outer_provenance_nodes(str(depth - 1))
+        self.assertEqual(actual, {str(i) for i in range(depth)})
+
     def test_v5_relabel_nodes(self):
         # This function modifies labels in place by default,
         # so create a local ProvDAG to protect our test data
-        dag = ProvDAG(str(TEST_DATA['5']['qzv_fp']))
+        dag = ProvDAG(self.dags['5'])
         # Test new node names
         exp_nodes = ['ffb7cee3',
                      '0af08fa8',
@@ -367,6 +375,16 @@ class ProvDAGTests(unittest.TestCase):
         terminal_uuid, *_ = dag.terminal_uuids
         self.assertEqual(terminal_uuid, exp_nodes[0])
 
+    def test_v5_relabel_nodes_clears_cached_views(self):
+        dag = ProvDAG(self.dags['5'])
+        # populate the caches before relabeling
+        exp_view_nodes = {node[:8] for node in dag.collapsed_view}
+        self.assertEqual(len(dag.terminal_uuids), 1)
+
+        dag.relabel_nodes({node: node[:8] for node in dag.nodes})
+        self.assertEqual(set(dag.collapsed_view), exp_view_nodes)
+        self.assertEqual(dag.terminal_uuids, {'ffb7cee3'})
+
     def test_v5_relabel_nodes_with_copy(self):
         exp_nodes = ['ffb7cee3',
                      '0af08fa8',
@@ -402,6 +420,21 @@ class ProvDAGTests(unittest.TestCase):
         terminal_uuid, *_ = new_dag.terminal_uuids
         self.assertEqual(terminal_uuid, exp_nodes[0])
 
+    def test_v5_relabel_nodes_with_copy_leaves_original(self):
+        dag = ProvDAG(self.dags['5'])
+        original_nodes = set(dag.nodes)
+        new_dag = dag.relabel_nodes(
+            {node: node[:8] for node in dag.nodes}, copy=True)
+
+        self.assertEqual(set(dag.nodes), original_nodes)
+        self.assertEqual(dag.parsed_artifact_uuids,
+                         {TEST_DATA['5']['uuid']})
+        for node in dag.nodes:
+            self.assertEqual(node, dag.get_node_data(node)._uuid)
+            self.assertIsNot(dag.get_node_data(node),
+                             new_dag.get_node_data(node[:8]))
+        self.assertEqual(new_dag.parsed_artifact_uuids, {'ffb7cee3'})
+
     def test_v5_collapsed_view(self):
         exp_nodes = {'ffb7cee3-2f1f-4988-90cc-efd5184ef003',
                      'bce3d09b-e296-4f2b-9af4-834db6412429',
@@ -412,10 +445,32 @@ class ProvDAGTests(unittest.TestCase):
                      }
         view = self.dags['5'].collapsed_view
         self.assertIsInstance(view, DiGraph)
+        self.assertTrue(nx.is_frozen(view))
         self.assertEqual(len(view), 6)
         for node in exp_nodes:
             self.assertIn(node, view.nodes)
 
+    def test_collapsed_view_follows_dag_order(self):
+        for dag in self.dags.values():
+            view = dag.collapsed_view
+            exp = [node for node in dag.dag if node in view]
+            self.assertEqual(list(view), exp)
+            for node in view:
+                self.assertEqual(list(view.succ[node]),
+                                 [n for n in dag.dag.succ[node] if n in view])
+
+    def test_collapsed_view_order_with_few_outer_nodes(self):
+        # with outer nodes under half of the DAG, DiGraph.subgraph iterates
+        # the (hash-ordered) node set instead of the DAG
+        dag = ProvDAG(self.dags['5'])
+        roots = [f'root_{i}' for i in range(6)]
+        inner = [f'inner_{i}' for i in range(20)]
+        dag.dag.add_nodes_from(roots + inner, node_data=None,
+                               has_provenance=False)
+        dag.dag.add_edges_from((r, 'inner_0') for r in roots)
+        dag._outer_nodes = frozenset(roots)
+        self.assertEqual(list(dag.collapsed_view), roots)
+
     def test_invalid_provenance(self):
         """
         Mangle an intact v5 Archive so that its checksums.md5 is invalid,
@@ -728,6 +783,62 @@ class ProvDAGUnionTests(unittest.TestCase):
         self.assertEqual(
             nx.number_weakly_connected_components(unioned_dag.dag), 3)
 
+    def test_union_keeps_argument_order(self):
+        """
+        Nodes follow the order the dags are passed in, as with compose_all,
+        whatever the dags' sizes
+        """
+        self.assertNotEqual(len(self.v3_dag), len(self.v5_qzv))
+        for dags in ([self.v3_dag, self.v5_qzv], [self.v5_qzv, self.v3_dag]):
+            unioned_dag = ProvDAG.union(dags)
+            self.assertEqual(list(unioned_dag.dag),
+                             list(nx.compose_all(dag.dag for dag in dags)))
+            self.assertEqual(list(unioned_dag.dag)[:len(dags[0])],
+                             list(dags[0].dag))
+
+    def test_union_does_not_modify_inputs(self):
+        """
+        The unioned graph is built from a copy, so the graphs of the ProvDAGs
+        passed in must be left as they were
+        """
+        v4_nodes = set(self.v4_dag.dag.nodes)
+        qzv_nodes = set(self.v5_qzv.dag.nodes)
+        unioned_dag = ProvDAG.union([self.v4_dag, self.v5_qzv])
+
+        self.assertIsNot(unioned_dag.dag, self.v4_dag.dag)
+        self.assertEqual(set(self.v4_dag.dag.nodes), v4_nodes)
+        self.assertEqual(set(self.v5_qzv.dag.nodes), qzv_nodes)
+        self.assertEqual(set(unioned_dag.dag.nodes), v4_nodes | qzv_nodes)
+
+    def test_union_keeps_parsed_node_data(self):
+        """
+        A node that is a bare !no-provenance parent in one DAG must keep its
+        parsed node_data from another DAG, whatever order they're passed in
+        """
+        stand_in = ProvDAG()
+        stand_in.dag.add_node(self.qzv_uuid, node_data=None,
+                              has_provenance=False)
+        stand_in.dag.add_node('child', node_data=None, has_provenance=False)
+        stand_in.dag.add_edge(self.qzv_uuid, 'child')
+
+        for dags in ([self.v5_qzv, stand_in], [stand_in, self.v5_qzv]):
+            unioned_dag = ProvDAG.union(dags)
+            self.assertIsNotNone(unioned_dag.get_node_data(self.qzv_uuid))
+            self.assertTrue(unioned_dag.dag.has_edge(self.qzv_uuid, 'child'))
+
+    def test_union_reduces_cfg_over_all_dags(self):
+        no_md_dag = ProvDAG(str(TEST_DATA['5']['qzv_fp']),
+                            parse_metadata=False)
+        unioned_dag = ProvDAG.union([no_md_dag, self.v4_dag])
+        self.assertFalse(unioned_dag.cfg.parse_study_metadata)
+        self.assertTrue(unioned_dag.cfg.perform_checksum_validation)
+
+    def test_union_does_not_alias_checksum_diff(self):
+        unioned_dag = ProvDAG.union([self.v5_qzv, self.v5_qzv])
+        self.assertEqual(unioned_dag.checksum_diff, self.v5_qzv.checksum_diff)
+        self.assertIsNot(unioned_dag.checksum_diff,
+                         self.v5_qzv.checksum_diff)
+
     def test_union_self_missing_checksums_md5(self):
         """
         Tests unions of v5 dags where the calling ProvDAG is missing its
@@ -668,7 +668,6 @@ class InitializerTests(unittest.TestCase):
         self.assertEqual(var.var_type, 'column')
 
         rendered = cfg.use.render()
-        print(rendered)
         self.assertRegex(rendered, 'from qiime2 import Metadata')
         exp = (r"barcodes_0_md = Metadata.load\('.*md_out/test_a/test_o.tsv'")
         self.assertRegex(rendered, exp)
@@ -61,6 +61,23 @@ class GetNonRootUUIDTests(unittest.TestCase):
         self.assertEqual(get_nonroot_uuid(md_example), exp)
         self.assertEqual(get_nonroot_uuid(action_example), exp)
 
+    def test_get_nonroot_uuid_from_str(self):
+        md_example = 'arch_root/provenance/artifacts/uuid123/metadata.yaml'
+        action_example = \
+            'arch_root/provenance/artifacts/uuid123/action/action.yaml'
+        exp = 'uuid123'
+
+        self.assertEqual(get_nonroot_uuid(md_example), exp)
+        self.assertEqual(get_nonroot_uuid(action_example), exp)
+
+    def test_get_nonroot_uuid_is_interned(self):
+        md_example = pathlib.Path(
+            'arch_root/provenance/artifacts/uuid123/metadata.yaml')
+        action_example = pathlib.Path(
+            'arch_root/provenance/artifacts/uuid123/action/action.yaml')
+        self.assertIs(get_nonroot_uuid(md_example),
+                      get_nonroot_uuid(action_example))
+
 
 class CustomAssertionsTests(CustomAssertions):
     def test_assert_re_appears_only_once(self):
@@ -2,6 +2,7 @@ import unittest
 import warnings
 import yaml
 
+from .._archive_parser import _ProvYAMLLoader
 from .._yaml_constructors import MetadataInfo
 
 
@@ -20,37 +21,46 @@ class YamlConstructorTests(unittest.TestCase):
         tag = r"!foo 'this is not an implemented tag'"
         with self.assertRaisesRegex(yaml.constructor.ConstructorError,
                                     'could not determine a constructor.*!foo'):
-            yaml.safe_load(tag)
+            yaml.load(tag, Loader=_ProvYAMLLoader)
+
+    def test_global_loaders_not_modified(self):
+        tag = r"!ref 'environment:plugins:diversity'"
+        for loader in (yaml.SafeLoader, getattr(yaml, 'CSafeLoader', None)):
+            if loader is None:
+                continue  # pragma: no cover
+            with self.assertRaisesRegex(yaml.constructor.ConstructorError,
+                                        'could not determine.*!ref'):
+                yaml.load(tag, Loader=loader)
 
     def test_citation_key_constructor(self):
         tag = r"!cite 'framework|qiime2:2020.6.0.dev0|0'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(actual, 'framework|qiime2:2020.6.0.dev0|0')
 
     def test_color_primitive_constructor(self):
         tag = r"!color '#57f289'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(actual, '#57f289')
 
     def test_forward_ref_action_plugin_ref(self):
         tag = r"plugin: !ref 'environment:plugins:diversity'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(actual, {'plugin': 'diversity'})
 
     def test_forward_ref_generic_ref(self):
         tag = r"plugin: !ref 'environment:framework:version'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         exp = {'plugin': ['environment', 'framework', 'version']}
         self.assertEqual(exp, actual)
 
     def test_metadata_path_constructor(self):
         tag = r"!metadata 'metadata.tsv'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(actual, MetadataInfo([], 'metadata.tsv'))
 
     def test_metadata_path_constructor_one_Artifact_as_md(self):
         tag = r"!metadata '415409a4-stuff-e3eaba5301b4:feature_metadata.tsv'"
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(
             actual,
             MetadataInfo(['415409a4-stuff-e3eaba5301b4'],
@@ -60,7 +70,7 @@ class YamlConstructorTests(unittest.TestCase):
         tag = (r"!metadata '415409a4-stuff-e3eaba5301b4,"
                r"12345-other-stuff-67890"
                r":feature_metadata.tsv'")
-        actual = yaml.safe_load(tag)
+        actual = yaml.load(tag, Loader=_ProvYAMLLoader)
         self.assertEqual(
             actual,
             MetadataInfo(['415409a4-stuff-e3eaba5301b4',
@@ -71,7 +81,7 @@ class YamlConstructorTests(unittest.TestCase):
         tag = "!no-provenance '34b07e56-27a5-4f03-ae57-ff427b50aaa1'"
         with self.assertWarnsRegex(UserWarning,
                                    'Artifact 34b07e.*prior to provenance'):
-            actual = yaml.safe_load(tag)
+            actual = yaml.load(tag, Loader=_ProvYAMLLoader)
             self.assertEqual(actual, '34b07e56-27a5-4f03-ae57-ff427b50aaa1')
 
     def test_no_provenance_multiple_warnings_fire(self):
@@ -82,7 +92,7 @@ class YamlConstructorTests(unittest.TestCase):
         with warnings.catch_warnings(record=True) as w:
             # Just in case something else has modified the filter state
             warnings.simplefilter("default")
-            yaml.safe_load(tag_list)
+            yaml.load(tag_list, Loader=_ProvYAMLLoader)
             # There should be exactly two warnings
             self.assertEqual(len(w), 2)
 
@@ -98,11 +108,11 @@ class YamlConstructorTests(unittest.TestCase):
 
     def test_set_ref(self):
         flow_tag = r"!set ['foo', 'bar', 'baz']"
-        flow = yaml.safe_load(flow_tag)
+        flow = yaml.load(flow_tag, Loader=_ProvYAMLLoader)
         self.assertEqual(flow, {'foo', 'bar', 'baz'})
 
         # NOTE: we don't expect duplicate values here (because dumped values
         # were a set), but it doesn't hurt to test the behavior
         block_tag = '!set\n- spam\n- egg\n- spam\n'
-        block = yaml.safe_load(block_tag)
+        block = yaml.load(block_tag, Loader=_ProvYAMLLoader)
         self.assertEqual(block, {'spam', 'egg'})
@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 from typing import Generator
 import pathlib
+import re
 import tempfile
 import unittest
 import zipfile
@@ -15,23 +16,18 @@ class CustomAssertions(unittest.TestCase):
         self.assertRegex(text, appears_once_re, msg)
 
 
+# root provenance files, and files available at the archive root
+_ROOT_PROVNODE_DATA = re.compile(
+    r'^[^/]+/(?:provenance/(?!.*artifacts).*(?:action\.yaml|citations\.bib)'
+    r'|(?:VERSION|metadata\.yaml|checksums\.md5)(?:/|$))')
+
+
 def is_root_provnode_data(fp):
     """
     a filter predicate which returns metadata, action, citation,
     and VERSION fps with which we can construct a ProvNode
     """
-    # Handle provenance files...
-    if 'provenance' in fp and 'artifacts' not in fp \
-        and ('action.yaml' in fp or
-             'citations.bib' in fp
-             ):
-        return True
-
-    # then handle files available at root, which require a cast
-    if pathlib.Path(fp).parts[1] in ('VERSION',
-                                     'metadata.yaml',
-                                     'checksums.md5'):
-        return True
+    return _ROOT_PROVNODE_DATA.match(str(fp)) is not None
 
 
 @contextmanager
@@ -49,17 +45,20 @@ def generate_archive_with_file_removed(qzv_fp: str, root_uuid: UUID,
     in as `metadata.yaml`
 
     adapted from https://stackoverflow.com/a/513889/9872253
+
+    Many tests build one of these per case, so the copy is stored rather than
+    recompressed. This is several times faster, and the archive's contents
+    (and so its checksums) are unchanged.
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         tmp_arc = pathlib.Path(tmpdir) / 'mangled.qzv'
-        fp_pfx = pathlib.Path(root_uuid)
+        drop_filename = str(pathlib.Path(root_uuid) / file_to_drop)
         zin = zipfile.ZipFile(qzv_fp, 'r')
         zout = zipfile.ZipFile(str(tmp_arc), 'w')
         for item in zin.infolist():
-            buffer = zin.read(item.filename)
-            drop_filename = str(fp_pfx / file_to_drop)
             if (item.filename != drop_filename):
-                zout.writestr(item, buffer)
+                buffer = zin.read(item.filename)
+                zout.writestr(item, buffer, compress_type=zipfile.ZIP_STORED)
         zout.close()
         zin.close()
         yield tmp_arc
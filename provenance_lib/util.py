@@ -1,5 +1,8 @@
+import os
 import pathlib
 import re
+import sys
+from typing import Union
 import zipfile
 
 # Alias string as UUID so we can specify types more clearly
@@ -9,6 +12,11 @@ UUID = str
 # FileNames are not path objects - just strings that describe paths
 FileName = str
 
+# Thread pools read archives through one ZipFile per worker. YAML parsing holds
+# the GIL, so pools stop scaling after a few threads, while each extra worker
+# still opens its own ZipFile
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
 
 def get_root_uuid(zf: zipfile.ZipFile) -> UUID:
     """
@@ -18,20 +26,29 @@ def get_root_uuid(zf: zipfile.ZipFile) -> UUID:
     Artifacts store their contents in a directory named with the Artifact's
     UUID, so we can get the UUID of an artifact by taking the first part of the
     filepath of any file in the zip archive.
+
+    infolist() returns the ZipFile's own cached index rather than building a
+    new list of names, so this is cheap enough to call once per node.
+
+    UUIDs are used as DAG keys everywhere, so we intern them: identical ids
+    then share one object, and dict lookups short-circuit on identity.
     """
-    return pathlib.Path(zf.namelist()[0]).parts[0]
+    return sys.intern(zf.infolist()[0].filename.split('/', 1)[0])
 
 
-def get_nonroot_uuid(fp: pathlib.Path) -> UUID:
+def get_nonroot_uuid(fp: Union[pathlib.Path, FileName]) -> UUID:
     """
     For non-root provenance files, get the Result's uuid from the path
     (avoiding the root Result's UUID which is in all paths)
+
+    Accepts zip archive member names as strings, or as pathlib paths.
     """
-    if fp.name == 'action.yaml':
-        uuid = fp.parts[-3]
+    parts = fp.parts if isinstance(fp, pathlib.PurePath) else fp.split('/')
+    if parts[-1] == 'action.yaml':
+        uuid = parts[-3]
     else:
-        uuid = fp.parts[-2]
-    return uuid
+        uuid = parts[-2]
+    return sys.intern(uuid)
 
 
 def camel_to_snake(name: str) -> str:
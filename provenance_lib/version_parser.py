@@ -1,11 +1,12 @@
 import codecs
+import functools
 import pathlib
 import re
 import warnings
 import zipfile
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
-from .util import get_nonroot_uuid, get_root_uuid
+from .util import FileName, get_nonroot_uuid, get_root_uuid
 
 _VERSION_MATCHER = (
     r'QIIME 2\n'
@@ -13,6 +14,8 @@ _VERSION_MATCHER = (
     r'framework: '
     r'(?:20[0-9]{2}|2)\.(?:[1-9][0-2]?|0)\.[0-9](?:\.dev[0-9]?)?'
     r'(?:\+[.\w]+)?\Z')
+# The pattern string is kept for error messages; matching uses the compiled RE
+_VERSION_RE = re.compile(_VERSION_MATCHER, re.MULTILINE)
 
 
 def parse_version_from_fp(fp: pathlib.Path) -> Tuple[str, str]:
@@ -27,21 +30,23 @@ def parse_version_from_fp(fp: pathlib.Path) -> Tuple[str, str]:
         return parse_version(zf)
 
 
-def parse_version(zf: zipfile.ZipFile,
-                  fp: Optional[pathlib.Path] = None) -> Tuple[str, str]:
+def parse_version(
+        zf: zipfile.ZipFile,
+        fp: Optional[Union[pathlib.Path, FileName]] = None) -> \
+        Tuple[str, str]:
     """Parse a VERSION file - by default uses the VERSION at archive root"""
-    root_uuid = get_root_uuid(zf)
+    version_fp: FileName
     if fp is not None:
-        version_fp = fp
+        version_fp = str(fp)
         node_uuid = get_nonroot_uuid(fp)
     else:
         # All files in zf start with root uuid, so we'll grab it from the first
-        version_fp = pathlib.Path(root_uuid) / 'VERSION'
-        node_uuid = root_uuid
+        node_uuid = get_root_uuid(zf)
+        version_fp = f'{node_uuid}/VERSION'
 
     try:
-        with zf.open(str(version_fp)) as v_fp:
-            version_contents = str(v_fp.read().strip(), 'utf-8')
+        with zf.open(version_fp) as v_fp:
+            version_contents = v_fp.read().decode('utf-8').strip()
     except KeyError:
 
         raise ValueError(
@@ -49,7 +54,7 @@ def parse_version(zf: zipfile.ZipFile,
             f"or nonexistent\nArchive {zf.filename} may be corrupt or "
             "provenance may be false.")
 
-    if not re.match(_VERSION_MATCHER, version_contents, re.MULTILINE):
+    if (versions := _parse_version_contents(version_contents)) is None:
         warnings.filterwarnings('ignore', 'invalid escape sequence',
                                 DeprecationWarning)
         _vrsn_mtch_repr = codecs.decode(_VERSION_MATCHER.encode('utf-8'),
@@ -59,6 +64,22 @@ def parse_version(zf: zipfile.ZipFile,
             f"\nShould match this RE:\n{_vrsn_mtch_repr}\n\n"
             f"Actually looks like:\n{version_contents}\n")
 
+    return versions
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_version_contents(version_contents: str) -> \
+        Optional[Tuple[str, str]]:
+    """
+    Returns (archive_version, framework_version) from the contents of a VERSION
+    file, or None if the contents are out of spec.
+
+    Every node in an archive has its own VERSION file, but most of them are
+    identical, so we only match and split each distinct VERSION once.
+    """
+    if not _VERSION_RE.match(version_contents):
+        return None
+
     _, archive_version, frmwk_vrsn = [
         line.strip().split()[-1] for line in
         version_contents.split(sep='\n') if line]